@@ -0,0 +1,234 @@
+#!/usr/bin/env python3
+"""
+Time each stage of building and rendering a pixel grid on a synthetic league.
+
+Stages are timed separately, so a regression points at the code that caused
+it. Results can be written as JSON and compared against an earlier run:
+
+    python benchmarks/pipeline.py --output baseline.json
+    # ...make changes...
+    python benchmarks/pipeline.py --compare baseline.json --fail-above 1.2
+
+Scale options (--teams, --weeks, --roster-size, --players) control the size
+of the generated league.
+"""
+
+import argparse
+import io
+import json
+import platform
+import statistics
+import sys
+import tempfile
+import timeit
+from collections.abc import Callable
+from datetime import datetime, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
+sys.path.insert(0, str(Path(__file__).resolve().parent))
+
+from rich.console import Console  # noqa: E402
+from synthetic import generate_league  # noqa: E402
+
+from sleeper_pixels import __version__  # noqa: E402
+from sleeper_pixels.grid import _prepare_player_data, export_html, render_pixel_grid  # noqa: E402
+from sleeper_pixels.index import RosterIndex  # noqa: E402
+from sleeper_pixels.players import PlayerIndex  # noqa: E402
+from sleeper_pixels.rankings import (  # noqa: E402
+    RANKED_POSITIONS,
+    build_roster_performance,
+    calculate_weekly_rankings,
+)
+
+# Results format; bump when keys change so old baselines aren't misread
+RESULTS_VERSION = 1
+
+
+def measure(func: Callable[[], object], repeat: int) -> dict:
+    """Time a function: calibrate loops to ~0.2s per sample, then take `repeat` samples."""
+    timer = timeit.Timer(func)
+    loops, _ = timer.autorange()
+    samples = [t / loops for t in timer.repeat(repeat=repeat, number=loops)]
+    return {
+        "loops": loops,
+        "repeat": repeat,
+        "min": min(samples),
+        "median": statistics.median(samples),
+    }
+
+
+def run_benchmarks(args: argparse.Namespace) -> dict:
+    """Generate a league and time each stage against it."""
+    league = generate_league(
+        teams=args.teams,
+        weeks=args.weeks,
+        roster_size=args.roster_size,
+        players=args.players,
+        seed=args.seed,
+    )
+    players = PlayerIndex.from_players_db(league.players_db)
+    players_body = json.dumps(league.players_db).encode()
+    weekly = league.weekly_matchups
+    max_week = league.weeks
+
+    roster_index = RosterIndex.from_matchups(weekly)
+    roster_id = roster_index.roster_ids()[0]
+    roster_players = roster_index.roster_players(roster_id)
+    roster_weeks = roster_index.roster_weeks(roster_id)
+    results = build_roster_performance(
+        roster_players, weekly, players, max_week, roster_weeks
+    )
+
+    def stream_index() -> PlayerIndex:
+        chunks = (players_body[i : i + 65536] for i in range(0, len(players_body), 65536))
+        return PlayerIndex.from_json_stream(chunks, positions=RANKED_POSITIONS)
+
+    def rank_all_weeks() -> None:
+        for matchups in weekly.values():
+            calculate_weekly_rankings(matchups, players)
+
+    def render(renderer: str) -> Callable[[], None]:
+        def run() -> None:
+            console = Console(
+                file=io.StringIO(), force_terminal=True, color_system="256", width=200
+            )
+            render_pixel_grid(
+                results,
+                "Benchmark Team",
+                "2024",
+                max_week,
+                console,
+                roster_weeks=roster_weeks,
+                renderer=renderer,
+            )
+
+        return run
+
+    temp_dir = tempfile.TemporaryDirectory(prefix="sleeper-pixels-bench-")
+    output_dir = Path(temp_dir.name)
+
+    def export(style: str) -> Callable[[], None]:
+        path = output_dir / f"{style}.html"
+
+        def run() -> None:
+            export_html(
+                results,
+                "Benchmark Team",
+                "2024",
+                max_week,
+                path,
+                roster_weeks=roster_weeks,
+                style=style,
+            )
+
+        return run
+
+    stages: list[tuple[str, Callable[[], object]]] = [
+        ("PlayerIndex.from_players_db", lambda: PlayerIndex.from_players_db(league.players_db)),
+        (
+            "PlayerIndex[json.loads]",
+            lambda: PlayerIndex.from_players_db(json.loads(players_body)),
+        ),
+        ("PlayerIndex.from_json_stream", stream_index),
+        ("calculate_weekly_rankings[season]", rank_all_weeks),
+        (
+            "build_roster_performance",
+            lambda: build_roster_performance(
+                roster_players, weekly, players, max_week, roster_weeks
+            ),
+        ),
+        ("_prepare_player_data", lambda: _prepare_player_data(results)),
+        ("render_pixel_grid[rich]", render("rich")),
+        ("render_pixel_grid[auto]", render("auto")),
+        ("export_html[inline]", export("inline")),
+        ("export_html[compact]", export("compact")),
+        ("export_html[data]", export("data")),
+    ]
+
+    selected = [s for s in stages if not args.only or any(o in s[0] for o in args.only)]
+    benchmarks = []
+    with temp_dir:
+        for name, func in selected:
+            benchmarks.append({"benchmark": name, **measure(func, args.repeat)})
+            if not args.json:
+                print(f"  {name:<36} {benchmarks[-1]['median'] * 1000:9.3f}ms", file=sys.stderr)
+
+    return {
+        "version": RESULTS_VERSION,
+        "meta": {
+            "sleeper_pixels": __version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "timestamp": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+            "scale": {
+                "teams": args.teams,
+                "weeks": args.weeks,
+                "roster_size": args.roster_size,
+                "players": len(league.players_db),
+                "seed": args.seed,
+                "result_rows": len(results),
+            },
+        },
+        "benchmarks": benchmarks,
+    }
+
+
+def compare(current: dict, baseline: dict) -> list[tuple[str, float, float, float]]:
+    """Pair up benchmarks with a baseline run as (name, baseline, current, ratio)."""
+    if baseline.get("version") != RESULTS_VERSION:
+        raise ValueError("Baseline was written by a different results format")
+    if baseline["meta"]["scale"] != current["meta"]["scale"]:
+        print("warning: baseline was run at a different scale", file=sys.stderr)
+
+    previous = {b["benchmark"]: b["median"] for b in baseline["benchmarks"]}
+    rows = []
+    for b in current["benchmarks"]:
+        if b["benchmark"] in previous:
+            before = previous[b["benchmark"]]
+            rows.append((b["benchmark"], before, b["median"], b["median"] / before))
+    return rows
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--teams", type=int, default=12, help="Teams in the league")
+    parser.add_argument("--weeks", type=int, default=17, help="Weeks of matchups")
+    parser.add_argument("--roster-size", type=int, default=16, help="Players per roster")
+    parser.add_argument("--players", type=int, default=11000, help="Player database size")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed for the league")
+    parser.add_argument("--repeat", "-n", type=int, default=5, help="Samples per stage")
+    parser.add_argument(
+        "--only", action="append", metavar="NAME", help="Run stages whose name contains NAME"
+    )
+    parser.add_argument("--output", "-o", type=Path, help="Write results JSON to a file")
+    parser.add_argument("--json", action="store_true", help="Print results JSON to stdout")
+    parser.add_argument("--compare", type=Path, metavar="FILE", help="Baseline results JSON")
+    parser.add_argument(
+        "--fail-above",
+        type=float,
+        metavar="RATIO",
+        help="With --compare, exit 1 if any stage is this many times slower",
+    )
+    args = parser.parse_args()
+
+    results = run_benchmarks(args)
+
+    if args.output:
+        args.output.write_text(json.dumps(results, indent=2) + "\n")
+    if args.json:
+        print(json.dumps(results, indent=2))
+
+    if args.compare:
+        rows = compare(results, json.loads(args.compare.read_text()))
+        print(f"\n{'stage':<36} {'baseline':>11} {'current':>11} {'ratio':>7}")
+        for name, before, after, ratio in rows:
+            print(f"{name:<36} {before * 1000:9.3f}ms {after * 1000:9.3f}ms {ratio:6.2f}x")
+        if args.fail_above and any(ratio > args.fail_above for *_, ratio in rows):
+            return 1
+
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
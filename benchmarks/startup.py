@@ -0,0 +1,117 @@
+#!/usr/bin/env python3
+"""
+Measure how long sleeper-pixels takes to start.
+
+Each scenario runs in a fresh interpreter, so module imports are paid every
+time, just as they are for a shell command or a batch child process:
+
+    python        an empty interpreter, for reference
+    import        import sleeper_pixels.cli
+    help          sleeper-pixels --help
+    minimal-run   sleeper-pixels <user> --replay <empty archive>, which parses
+                  arguments, creates the console and API client, and stops at
+                  the first API call
+
+Usage:
+    python benchmarks/startup.py [--repeat N] [--json]
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+SRC_DIR = Path(__file__).resolve().parent.parent / "src"
+
+# Modules whose presence shows a heavy dependency was imported
+HEAVY_MODULES = ("requests", "rich.console", "rich.table", "rich.live")
+
+# Runs sleeper_pixels in-process and reports its own timing and imports
+SNIPPET = """
+import contextlib, io, json, sys, time
+start = time.perf_counter()
+from sleeper_pixels.cli import main
+argv = {argv!r}
+if argv is not None:
+    with contextlib.redirect_stdout(io.StringIO()), contextlib.redirect_stderr(io.StringIO()):
+        try:
+            main(argv)
+        except SystemExit:
+            pass
+seconds = time.perf_counter() - start
+print(json.dumps({{"seconds": seconds, "modules": [m for m in {heavy!r} if m in sys.modules]}}))
+"""
+
+
+def cli_code(argv: list[str] | None) -> str:
+    """Code that imports the CLI and, unless argv is None, runs it."""
+    return SNIPPET.format(argv=argv, heavy=HEAVY_MODULES)
+
+
+def run_once(code: str) -> dict:
+    """Run a scenario's code in a new interpreter and return its timings."""
+    env = {**os.environ, "PYTHONPATH": str(SRC_DIR)}
+
+    start = time.perf_counter()
+    proc = subprocess.run(
+        [sys.executable, "-c", code], env=env, capture_output=True, text=True, check=True
+    )
+    wall = time.perf_counter() - start
+
+    result = json.loads(proc.stdout or '{"seconds": 0.0, "modules": []}')
+    result["wall"] = wall
+    return result
+
+
+def benchmark(name: str, code: str, repeat: int) -> dict:
+    """Run a scenario repeatedly and summarize it."""
+    runs = [run_once(code) for _ in range(repeat)]
+    walls = [r["wall"] for r in runs]
+    in_process = [r["seconds"] for r in runs]
+    return {
+        "benchmark": name,
+        "runs": repeat,
+        "wall_min": min(walls),
+        "wall_median": statistics.median(walls),
+        "in_process_median": statistics.median(in_process),
+        "heavy_modules": runs[-1]["modules"],
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0].strip())
+    parser.add_argument("--repeat", "-n", type=int, default=10, help="Runs per scenario")
+    parser.add_argument("--json", action="store_true", help="Print results as JSON")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as archive:
+        scenarios = [
+            ("python", "pass"),
+            ("import", cli_code(None)),
+            ("help", cli_code(["--help"])),
+            ("minimal-run", cli_code(["nobody", "--replay", archive])),
+        ]
+        results = [
+            benchmark(name, code, max(1, args.repeat)) for name, code in scenarios
+        ]
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+        return 0
+
+    print(f"{'scenario':<12} {'wall min':>9} {'wall med':>9} {'in-proc':>9}  heavy imports")
+    for r in results:
+        print(
+            f"{r['benchmark']:<12} {r['wall_min'] * 1000:8.1f}ms {r['wall_median'] * 1000:8.1f}ms "
+            f"{r['in_process_median'] * 1000:8.1f}ms  {', '.join(r['heavy_modules']) or '-'}"
+        )
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,209 @@
+"""
+Synthetic Sleeper payloads for benchmarks.
+
+Generates a /players/nfl database and a season of /league/<id>/matchups/<week>
+responses shaped like the real API, at any scale and reproducibly from a seed.
+"""
+
+import random
+from dataclasses import dataclass, field
+
+# Share of a real player database at each fantasy position; the rest are
+# linemen, defenders and other positions that never show up in matchups
+POSITION_SHARE = {
+    "QB": 0.03,
+    "RB": 0.06,
+    "WR": 0.09,
+    "TE": 0.05,
+    "K": 0.01,
+}
+
+# Other positions present in the real database
+OTHER_POSITIONS = ("OL", "OT", "OG", "C", "DL", "DE", "DT", "LB", "CB", "S", "DB", "LS", "P")
+
+# Mean and spread of weekly fantasy points by position
+POINTS = {
+    "QB": (17.0, 7.0),
+    "RB": (10.0, 7.0),
+    "WR": (10.0, 7.0),
+    "TE": (7.0, 5.0),
+    "K": (8.0, 4.0),
+    "DEF": (7.0, 6.0),
+}
+
+# Roster slots filled at each position, in order, before bench depth
+ROSTER_SHAPE = ("QB", "RB", "RB", "WR", "WR", "WR", "TE", "K", "DEF")
+
+NFL_TEAMS = (
+    "ARI", "ATL", "BAL", "BUF", "CAR", "CHI", "CIN", "CLE", "DAL", "DEN", "DET",
+    "GB", "HOU", "IND", "JAX", "KC", "LAC", "LAR", "LV", "MIA", "MIN", "NE", "NO",
+    "NYG", "NYJ", "PHI", "PIT", "SEA", "SF", "TB", "TEN", "WAS",
+)  # fmt: skip
+
+FIRST_NAMES = (
+    "Aaron", "Brandon", "Chris", "Derek", "Elijah", "Travis", "Justin", "Jalen",
+    "Marcus", "Tyler", "Kyle", "Josh", "Patrick", "Saquon", "Davante", "Mike",
+)  # fmt: skip
+LAST_NAMES = (
+    "Allen", "Brown", "Carter", "Davis", "Evans", "Foster", "Green", "Harris",
+    "Jackson", "Johnson", "Kelce", "Lewis", "Moore", "Robinson", "Smith", "Williams",
+)  # fmt: skip
+
+
+@dataclass
+class SyntheticLeague:
+    """A generated league: its players database and a season of matchups."""
+
+    players_db: dict[str, dict]
+    weekly_matchups: dict[int, list[dict]]
+    teams: int
+    weeks: int
+    roster_size: int
+    rosters: list[dict] = field(default_factory=list)
+
+
+def generate_players(count: int = 11000, seed: int = 0) -> dict[str, dict]:
+    """
+    Generate a /players/nfl payload with about `count` players.
+
+    Team defenses are keyed by team abbreviation and have no full_name,
+    as in the real database.
+    """
+    rng = random.Random(seed)
+    players: dict[str, dict] = {}
+
+    for team in NFL_TEAMS:
+        players[team] = {
+            "player_id": team,
+            "position": "DEF",
+            "fantasy_positions": ["DEF"],
+            "first_name": team,
+            "last_name": "Defense",
+            "team": team,
+            "active": True,
+            "status": None,
+        }
+
+    positions = list(POSITION_SHARE) + ["OTHER"]
+    weights = list(POSITION_SHARE.values()) + [1 - sum(POSITION_SHARE.values())]
+    player_id = 100
+    while len(players) < count:
+        player_id += rng.randint(1, 3)
+        position = rng.choices(positions, weights)[0]
+        if position == "OTHER":
+            position = rng.choice(OTHER_POSITIONS)
+        first = rng.choice(FIRST_NAMES)
+        last = rng.choice(LAST_NAMES)
+        active = rng.random() < 0.35
+        players[str(player_id)] = {
+            "player_id": str(player_id),
+            "position": position,
+            "fantasy_positions": [position],
+            "first_name": first,
+            "last_name": last,
+            "full_name": f"{first} {last}",
+            "search_full_name": f"{first}{last}".lower(),
+            "team": rng.choice(NFL_TEAMS) if active else None,
+            "number": rng.randint(1, 99),
+            "age": rng.randint(21, 38),
+            "years_exp": rng.randint(0, 15),
+            "height": str(rng.randint(68, 79)),
+            "weight": str(rng.randint(170, 330)),
+            "college": rng.choice(LAST_NAMES) + " State",
+            "active": active,
+            "status": "Active" if active else "Inactive",
+            "injury_status": rng.choice((None, None, None, "Questionable", "Out")),
+            "depth_chart_order": rng.randint(1, 4) if active else None,
+            "sport": "nfl",
+        }
+
+    return players
+
+
+def generate_matchups(
+    players_db: dict[str, dict],
+    teams: int = 12,
+    weeks: int = 17,
+    roster_size: int = 16,
+    seed: int = 0,
+    churn: float = 0.08,
+) -> dict[int, list[dict]]:
+    """
+    Generate a season of matchups payloads keyed by week.
+
+    Rosters are drafted from active fantasy-position players and change a
+    little every week (a `churn` share of bench spots is swapped for free
+    agents), so roster membership varies across the season like it does
+    with waivers and trades.
+    """
+    rng = random.Random(seed)
+    pools: dict[str, list[str]] = {pos: [] for pos in POINTS}
+    for player_id, info in players_db.items():
+        if info.get("position") in pools and info.get("active"):
+            pools[info["position"]].append(player_id)
+    for pool in pools.values():
+        rng.shuffle(pool)
+
+    def draft(position: str) -> str:
+        return pools[position].pop() if pools[position] else rng.choice(list(players_db))
+
+    bench_positions = ("QB", "RB", "RB", "WR", "WR", "TE")
+    rosters: list[list[str]] = []
+    for _ in range(teams):
+        shape = list(ROSTER_SHAPE[:roster_size])
+        while len(shape) < roster_size:
+            shape.append(rng.choice(bench_positions))
+        rosters.append([draft(pos) for pos in shape])
+
+    starters_count = min(len(ROSTER_SHAPE), roster_size)
+    weekly: dict[int, list[dict]] = {}
+    for week in range(1, weeks + 1):
+        if week > 1:
+            for roster in rosters:
+                for slot in range(starters_count, roster_size):
+                    if rng.random() < churn:
+                        position = players_db.get(roster[slot], {}).get("position", "WR")
+                        roster[slot] = draft(position if position in pools else "WR")
+
+        matchups = []
+        for index, roster in enumerate(rosters):
+            points = {}
+            for player_id in roster:
+                position = players_db.get(player_id, {}).get("position")
+                mean, spread = POINTS.get(position, (0.0, 0.0))
+                # About one player in twelve is on bye or inactive each week
+                scored = rng.random() > 1 / 12
+                points[player_id] = round(max(0.0, rng.gauss(mean, spread)), 2) if scored else 0.0
+            starters = roster[:starters_count]
+            matchups.append(
+                {
+                    "roster_id": index + 1,
+                    "matchup_id": index // 2 + 1,
+                    "points": round(sum(points[p] for p in starters), 2),
+                    "players": list(roster),
+                    "starters": starters,
+                    "players_points": points,
+                    "starters_points": [points[p] for p in starters],
+                    "custom_points": None,
+                }
+            )
+        weekly[week] = matchups
+
+    return weekly
+
+
+def generate_league(
+    teams: int = 12,
+    weeks: int = 17,
+    roster_size: int = 16,
+    players: int = 11000,
+    seed: int = 0,
+) -> SyntheticLeague:
+    """Generate a players database and a season of matchups for one league."""
+    players_db = generate_players(players, seed)
+    weekly_matchups = generate_matchups(players_db, teams, weeks, roster_size, seed)
+    rosters = [
+        {"roster_id": roster_id, "owner_id": f"user{roster_id}"}
+        for roster_id in range(1, teams + 1)
+    ]
+    return SyntheticLeague(players_db, weekly_matchups, teams, weeks, roster_size, rosters)
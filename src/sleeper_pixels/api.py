@@ -1,26 +1,219 @@
 """Sleeper API client."""
 
-import requests
-from functools import lru_cache
+import json
+import math
+import threading
+import time
+from collections.abc import Container, Iterable, Iterator
+from concurrent.futures import Future, ThreadPoolExecutor
+from pathlib import Path
+from typing import TYPE_CHECKING
+from urllib.parse import quote
+
+from .cache import read_chunks, read_json, tee_to_file, write_bytes, write_json
+from .players import PlayerIndex
+from .rankings import RANKED_POSITIONS
+from .ratelimit import TokenBucket, backoff_delay
+
+if TYPE_CHECKING:
+    import requests
+
+    from .profiling import Profiler
 
 BASE_URL = "https://api.sleeper.app/v1"
 
+# Default number of concurrent requests for multi-week fetches
+DEFAULT_MAX_WORKERS = 8
+
+# Seconds to wait to connect, and between bytes of a response, before giving up
+DEFAULT_TIMEOUT = 30.0
+
+# Sleeper asks clients to stay under 1000 calls per minute
+DEFAULT_RATE_LIMIT = 1000 / 60
+
+# Times to retry a request that was throttled, failed with a server error or
+# lost its connection
+DEFAULT_RETRIES = 4
+
+# Statuses worth retrying: throttling and transient server errors
+RETRY_STATUSES = frozenset({429, 500, 502, 503, 504})
+
+# Bytes read at a time when streaming the players database
+STREAM_CHUNK_SIZE = 64 * 1024
+
+# How long the on-disk players database is used without revalidating (seconds)
+DEFAULT_PLAYERS_TTL = 24 * 60 * 60
+
+
+class ReplayMissError(LookupError):
+    """Raised in replay mode when a response is not in the archive."""
+
 
 class SleeperAPI:
-    """Client for the Sleeper fantasy sports API."""
+    """
+    Client for the Sleeper fantasy sports API.
 
-    def __init__(self):
-        self.session = requests.Session()
+    Args:
+        max_workers: Max concurrent requests for multi-week fetches, and the size
+                     of the connection pool shared by all threads
+        timeout: Seconds to wait to connect or for more response data
+        cache_dir: Directory for the on-disk players cache (None disables it)
+        players_ttl: Seconds to use the cached players database before revalidating
+        record_dir: Save every response to this archive directory
+        replay_dir: Serve every response from this archive directory, with no network
+        profiler: Record the latency, size and status of every request, and the
+                  time spent decoding JSON
+        rate_limit: Max requests per second, sustained (None for no limit). The
+                    rate is lowered while the API responds 429 Too Many Requests
+        retries: Times to retry a request that was throttled, got a 5xx error or
+                 lost its connection, waiting longer (with jitter) each time
+        dedupe: Reuse the response to an earlier identical GET for the life of
+                the client. Leave off for long-running clients that need fresh
+                data; identical requests in flight at once are always shared.
+                Shared responses must be treated as read-only.
+    """
 
-    def _get(self, endpoint: str) -> dict | list | None:
-        """Make a GET request to the Sleeper API."""
-        response = self.session.get(f"{BASE_URL}{endpoint}")
+    def __init__(
+        self,
+        max_workers: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        cache_dir: Path | None = None,
+        players_ttl: float = DEFAULT_PLAYERS_TTL,
+        record_dir: Path | None = None,
+        replay_dir: Path | None = None,
+        profiler: "Profiler | None" = None,
+        rate_limit: float | None = DEFAULT_RATE_LIMIT,
+        retries: int = DEFAULT_RETRIES,
+        dedupe: bool = False,
+    ):
+        if record_dir is not None and replay_dir is not None:
+            raise ValueError("Cannot record and replay at the same time")
+        self.max_workers = max(1, max_workers)
+        self.timeout = timeout
+        # Recording and replaying need every response to go through _get,
+        # so the players disk cache is bypassed in those modes
+        self.cache_dir = cache_dir if record_dir is None and replay_dir is None else None
+        self.players_ttl = players_ttl
+        self.record_dir = record_dir
+        self.replay_dir = replay_dir
+        self.profiler = profiler
+        self.retries = max(0, retries)
+        self.dedupe = dedupe
+        self.rate_limiter = (
+            TokenBucket(rate_limit, burst=max(self.max_workers, math.ceil(rate_limit)))
+            if rate_limit
+            else None
+        )
+        self._responses: dict[str, Future] = {}
+        self._responses_lock = threading.Lock()
+        self._players: dict[str, dict] = {}
+        self._player_indexes: dict[str, PlayerIndex] = {}
+        # Replays never touch the network, so they skip loading requests
+        self.session = None if replay_dir is not None else _create_session(self.max_workers)
+
+    def _request(
+        self, endpoint: str, headers: dict[str, str] | None = None, stream: bool = False
+    ) -> "requests.Response":
+        """
+        Make a GET request to the Sleeper API and return the raw response.
+
+        Throttled (429), 5xx and dropped requests are retried up to `retries`
+        times with jittered exponential backoff, honoring Retry-After. With
+        stream=True the body is not read; the caller must consume or close it.
+        """
+        import requests
+
+        attempt = 0
+        while True:
+            if self.rate_limiter is not None:
+                self.rate_limiter.acquire()
+            start = time.perf_counter()
+            try:
+                response = self.session.get(
+                    f"{BASE_URL}{endpoint}",
+                    headers=headers,
+                    timeout=self.timeout,
+                    stream=stream,
+                )
+            except (requests.ConnectionError, requests.Timeout):
+                if self.profiler is not None:
+                    self.profiler.record_request(endpoint, None, 0, start)
+                if attempt >= self.retries:
+                    raise
+                attempt += 1
+                time.sleep(backoff_delay(attempt))
+                continue
+
+            if self.profiler is not None and not (stream and response.status_code == 200):
+                # A streamed body is recorded by _iter_body once it has been read
+                size = 0 if stream else len(response.content)
+                self.profiler.record_request(endpoint, response.status_code, size, start)
+            if response.status_code not in RETRY_STATUSES or attempt >= self.retries:
+                break
+            response.close()
+            if response.status_code == 429 and self.rate_limiter is not None:
+                self.rate_limiter.throttle()
+            attempt += 1
+            time.sleep(backoff_delay(attempt, retry_after=response.headers.get("Retry-After")))
+
+        if response.status_code >= 400:
+            response.close()
         response.raise_for_status()
-        return response.json()
+        if self.rate_limiter is not None:
+            self.rate_limiter.succeed()
+        if self.record_dir is not None and response.status_code == 200 and not stream:
+            write_bytes(_archive_path(self.record_dir, endpoint), response.content)
+        return response
+
+    def _get(self, endpoint: str) -> dict | list | None:
+        """Make a GET request to the Sleeper API (or the replay archive)."""
+        if self.replay_dir is not None:
+            path = _archive_path(self.replay_dir, endpoint)
+            start = time.perf_counter()
+            try:
+                content = path.read_bytes()
+            except FileNotFoundError:
+                raise ReplayMissError(f"No recorded response for {endpoint}") from None
+            if self.profiler is not None:
+                self.profiler.record_request(
+                    endpoint, 200, len(content), start, source="replay"
+                )
+            return self._parse(content)
+
+        # Share one request between threads asking for the same endpoint
+        with self._responses_lock:
+            future = self._responses.get(endpoint)
+            if future is None:
+                self._responses[endpoint] = owned = Future()
+        if future is not None:
+            return future.result()
+
+        try:
+            data = self._parse(self._request(endpoint).content)
+        except BaseException as e:
+            owned.set_exception(e)
+            self._forget(endpoint)
+            raise
+        owned.set_result(data)
+        if not self.dedupe:
+            self._forget(endpoint)
+        return data
+
+    def _forget(self, endpoint: str) -> None:
+        """Drop a shared response so the next GET of the endpoint is sent again."""
+        with self._responses_lock:
+            del self._responses[endpoint]
+
+    def _parse(self, content: bytes) -> dict | list | None:
+        """Decode a JSON response body, timing it when profiling."""
+        if self.profiler is None:
+            return json.loads(content)
+        with self.profiler.stage("parse", category="parse"):
+            return json.loads(content)
 
     def get_user(self, username: str) -> dict:
         """Get user info by username."""
-        return self._get(f"/user/{username}")
+        return self._get(f"/user/{_path_segment(username)}")
 
     def get_leagues(self, user_id: str, sport: str, season: str) -> list[dict]:
         """Get all leagues for a user in a given sport and season."""
@@ -30,23 +223,324 @@ class SleeperAPI:
         """Get league details."""
         return self._get(f"/league/{league_id}")
 
-    def get_rosters(self, league_id: str) -> list[dict]:
-        """Get all rosters in a league."""
-        return self._get(f"/league/{league_id}/rosters")
+    def get_rosters(self, league_id: str, final: bool = False) -> list[dict]:
+        """Get all rosters in a league (final=True if the league is complete)."""
+        return self._get_final(f"/league/{league_id}/rosters", final)
 
-    def get_users(self, league_id: str) -> list[dict]:
-        """Get all users in a league."""
-        return self._get(f"/league/{league_id}/users")
+    def get_users(self, league_id: str, final: bool = False) -> list[dict]:
+        """Get all users in a league (final=True if the league is complete)."""
+        return self._get_final(f"/league/{league_id}/users", final)
 
-    def get_matchups(self, league_id: str, week: int) -> list[dict]:
-        """Get matchups for a specific week."""
-        return self._get(f"/league/{league_id}/matchups/{week}")
+    def get_matchups(self, league_id: str, week: int, final: bool = False) -> list[dict]:
+        """Get matchups for a specific week (final=True if the week can no longer change)."""
+        return self._get_final(f"/league/{league_id}/matchups/{week}", final)
+
+    def get_season_matchups(
+        self,
+        league_id: str,
+        weeks: Iterable[int],
+        final_weeks: Container[int] = (),
+    ) -> dict[int, list[dict]]:
+        """Get matchups for several weeks concurrently, keyed by week."""
+        weeks = list(weeks)
+        if not weeks:
+            return {}
+
+        def fetch(week: int) -> list[dict]:
+            return self.get_matchups(league_id, week, final=week in final_weeks)
+
+        workers = min(self.max_workers, len(weeks))
+        with ThreadPoolExecutor(max_workers=workers) as pool:
+            return dict(zip(weeks, pool.map(fetch, weeks)))
+
+    def _get_final(self, endpoint: str, final: bool) -> dict | list | None:
+        """
+        GET an endpoint, keeping finalized responses on disk permanently.
+
+        Data marked final (completed weeks and seasons) can never change, so
+        once stored it is served from the cache_dir without a request.
+        """
+        if not final or self.cache_dir is None:
+            return self._get(endpoint)
+
+        path = _archive_path(self.cache_dir / "final", endpoint)
+        data = read_json(path)
+        if data is None:
+            data = self._get(endpoint)
+            if data is not None:
+                write_json(path, data)
+        return data
 
     def get_state(self, sport: str = "nfl") -> dict:
         """Get current state of the sport (week, season, etc.)."""
         return self._get(f"/state/{sport}")
 
-    @lru_cache(maxsize=1)
-    def get_players(self, sport: str = "nfl") -> dict:
-        """Get all players for a sport. Cached since this is ~5MB."""
-        return self._get(f"/players/{sport}")
+    def get_players(self, sport: str = "nfl", refresh: bool = False) -> dict:
+        """
+        Get all players for a sport.
+
+        Cached in memory, and on disk when a cache_dir is set, since this is ~5MB.
+        A stale disk copy is revalidated with ETag/Last-Modified before it is
+        downloaded again; refresh=True always downloads a fresh copy.
+        """
+        if refresh or sport not in self._players:
+            self._players[sport] = self._load_players(sport, refresh)
+        return self._players[sport]
+
+    def _load_players(self, sport: str, refresh: bool) -> dict:
+        """Load the players database from the disk cache or the API."""
+        if self.cache_dir is None:
+            return self._get(f"/players/{sport}")
+
+        data_path, _ = self._players_cache_paths(sport)
+        response = self._request_players(sport, refresh)
+        if response is None:
+            players = read_json(data_path)
+            if players is not None:
+                return players
+            # Cached copy is corrupt - download it in full
+            response = self._request_players(sport, refresh=True)
+
+        players = self._parse(response.content)
+        write_bytes(data_path, response.content)
+        self._save_players_meta(sport, response)
+        return players
+
+    def get_player_index(self, sport: str = "nfl", refresh: bool = False) -> PlayerIndex:
+        """
+        Get a compact index of all players for a sport.
+
+        Holds only the fields rankings need. When a cache_dir is set the index
+        is stored as a binary file next to the raw database, so repeat runs
+        skip both the download and the JSON parse.
+        """
+        if refresh or sport not in self._player_indexes:
+            self._player_indexes[sport] = self._load_player_index(sport, refresh)
+        return self._player_indexes[sport]
+
+    def _load_player_index(self, sport: str, refresh: bool) -> PlayerIndex:
+        """Load the player index from the disk cache or build it from the API."""
+        if not refresh and sport in self._players:
+            index = PlayerIndex.from_players_db(self._players[sport], positions=RANKED_POSITIONS)
+        else:
+            chunks, cached = self._stream_players(sport, refresh)
+            if cached:
+                # The cached database is current (fresh, or unchanged by a
+                # 304), so an index saved from the same download still holds
+                index = PlayerIndex.load(
+                    self._index_path(sport), source=self._players_download(sport)
+                )
+                if index is not None:
+                    return index
+            # Parse the database into the index as it streams in, dropping
+            # players at positions that are never ranked, rather than holding
+            # the whole body and its decoded dict in memory
+            try:
+                index = self._index_from_stream(chunks)
+            except ValueError:
+                if not cached:
+                    raise
+                # Cached copy is corrupt - download it in full
+                chunks, _ = self._stream_players(sport, refresh=True)
+                index = self._index_from_stream(chunks)
+        if self.cache_dir is not None:
+            index.save(self._index_path(sport), source=self._players_download(sport))
+        return index
+
+    def _index_from_stream(self, chunks: Iterator[bytes]) -> PlayerIndex:
+        """Build the index from a streamed players database, timing the parse when profiling."""
+        if self.profiler is not None:
+            # Only the parser's own work is timed; reading the chunks is the request
+            chunks = self.profiler.consumer_stage(chunks, "parse", category="parse")
+        return PlayerIndex.from_json_stream(chunks, positions=RANKED_POSITIONS)
+
+    def _index_path(self, sport: str) -> Path:
+        """Location of the cached player index."""
+        return self.cache_dir / f"players_{sport}.idx"
+
+    def _players_download(self, sport: str) -> float | None:
+        """When the cached players database was downloaded, which identifies its content."""
+        _, meta_path = self._players_cache_paths(sport)
+        return (read_json(meta_path) or {}).get("downloaded_at")
+
+    def _stream_players(self, sport: str, refresh: bool) -> tuple[Iterator[bytes], bool]:
+        """
+        Open the raw players database as a stream of chunks.
+
+        Reads from the disk cache, the replay archive or the API, the same
+        way _load_players does, saving a downloaded copy as it streams by.
+
+        Returns:
+            Tuple of (chunks, whether they are read from the disk cache)
+        """
+        endpoint = f"/players/{sport}"
+        if self.replay_dir is not None:
+            path = _archive_path(self.replay_dir, endpoint)
+            if not path.exists():
+                raise ReplayMissError(f"No recorded response for {endpoint}")
+            chunks = read_chunks(path)
+            if self.profiler is not None:
+                chunks = self._recorded(endpoint, chunks, 200, source="replay")
+            return chunks, False
+
+        if self.cache_dir is None:
+            record_path = (
+                _archive_path(self.record_dir, endpoint) if self.record_dir is not None else None
+            )
+            response = self._request(endpoint, stream=True)
+            return self._iter_body(endpoint, response, record_path), False
+
+        data_path, _ = self._players_cache_paths(sport)
+        response = self._request_players(sport, refresh, stream=True)
+        if response is None:
+            return read_chunks(data_path), True
+        return self._download_players(sport, response), False
+
+    def _iter_body(
+        self, endpoint: str, response: "requests.Response", save_path: Path | None = None
+    ) -> Iterator[bytes]:
+        """Yield a streamed response body in chunks, optionally saving it to a file."""
+        with response:
+            chunks = response.iter_content(STREAM_CHUNK_SIZE)
+            if self.profiler is not None:
+                # Start from the time to headers, as measured by requests
+                waited = response.elapsed.total_seconds()
+                chunks = self._recorded(
+                    endpoint, chunks, response.status_code, waited=waited
+                )
+            if save_path is not None:
+                chunks = tee_to_file(save_path, chunks)
+            yield from chunks
+
+    def _download_players(self, sport: str, response: "requests.Response") -> Iterator[bytes]:
+        """Yield a new players database as it downloads, saving it to the disk cache."""
+        data_path, _ = self._players_cache_paths(sport)
+        yield from self._iter_body(f"/players/{sport}", response, data_path)
+        self._save_players_meta(sport, response)
+
+    def _recorded(
+        self,
+        endpoint: str,
+        chunks: Iterable[bytes],
+        status: int,
+        source: str = "network",
+        waited: float = 0.0,
+    ) -> Iterator[bytes]:
+        """
+        Yield a streamed body, recording the request once it has all been read.
+
+        Only time spent waiting for chunks counts (plus `waited` before the
+        first), not the time the caller spends on each one, so parsing the
+        body as it streams in is not mistaken for the request. The size is
+        the bytes actually received.
+        """
+        start = time.perf_counter() - waited
+        seconds = waited
+        size = 0
+        chunks = iter(chunks)
+        try:
+            while True:
+                read_start = time.perf_counter()
+                chunk = next(chunks, None)
+                seconds += time.perf_counter() - read_start
+                if chunk is None:
+                    break
+                size += len(chunk)
+                yield chunk
+        finally:
+            self.profiler.record_request(
+                endpoint, status, size, start, source=source, seconds=seconds
+            )
+
+    def _players_cache_paths(self, sport: str) -> tuple[Path, Path]:
+        """Locations of the cached players database and its metadata."""
+        return (
+            self.cache_dir / f"players_{sport}.json",
+            self.cache_dir / f"players_{sport}.meta.json",
+        )
+
+    def _request_players(
+        self, sport: str, refresh: bool, stream: bool = False
+    ) -> "requests.Response | None":
+        """
+        Check the cached players database, revalidating a stale copy.
+
+        Shared by _load_players and _stream_players. Returns None when the
+        cached file can be used (fresh, or confirmed unchanged by a 304),
+        otherwise the response carrying a new copy; the caller saves its body
+        and then calls _save_players_meta().
+        """
+        endpoint = f"/players/{sport}"
+        data_path, meta_path = self._players_cache_paths(sport)
+        meta = read_json(meta_path) or {}
+        cached = not refresh and data_path.exists()
+        if cached and self._is_fresh(meta):
+            return None
+
+        # Revalidate the stale copy instead of downloading it again
+        headers: dict[str, str] = {}
+        if cached:
+            if meta.get("etag"):
+                headers["If-None-Match"] = meta["etag"]
+            if meta.get("last_modified"):
+                headers["If-Modified-Since"] = meta["last_modified"]
+
+        response = self._request(endpoint, headers=headers or None, stream=stream)
+        if response.status_code != 304:
+            return response
+        response.close()
+        if data_path.exists():
+            meta["fetched_at"] = time.time()
+            write_json(meta_path, meta)
+            return None
+        # Cached copy vanished - download it in full
+        return self._request(endpoint, stream=stream)
+
+    def _save_players_meta(self, sport: str, response: "requests.Response") -> None:
+        """Record when a new players database was fetched, for revalidation."""
+        _, meta_path = self._players_cache_paths(sport)
+        now = time.time()
+        # fetched_at moves on when a 304 confirms the copy; downloaded_at only
+        # changes with the content
+        write_json(
+            meta_path,
+            {
+                "fetched_at": now,
+                "downloaded_at": now,
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            },
+        )
+
+    def _is_fresh(self, meta: dict) -> bool:
+        """Check whether cached players metadata is within the TTL."""
+        return time.time() - meta.get("fetched_at", 0) < self.players_ttl
+
+
+def _create_session(max_workers: int) -> "requests.Session":
+    """Create an HTTP session (requests is imported here, when first needed)."""
+    import requests
+    from requests.adapters import HTTPAdapter
+
+    session = requests.Session()
+    # Size the connection pool so concurrent fetches reuse keep-alive
+    # connections, and block when it is exhausted rather than opening
+    # extra connections that are thrown away afterwards
+    session.mount("https://", HTTPAdapter(pool_maxsize=max_workers, pool_block=True))
+    return session
+
+
+def _path_segment(value: str) -> str:
+    """Percent-encode a value so it is exactly one segment of an endpoint path."""
+    segment = quote(value, safe="")
+    # "." and ".." would otherwise be resolved against the parent path
+    return segment.replace(".", "%2E") if not segment.strip(".") else segment
+
+
+def _archive_path(root: Path, endpoint: str) -> Path:
+    """Map an endpoint to its file in a record/replay archive."""
+    segments = [
+        quote(segment, safe="").replace(".", "%2E")
+        for segment in endpoint.strip("/").split("/")
+    ]
+    return root.joinpath(*segments).with_suffix(".json")
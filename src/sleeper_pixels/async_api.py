@@ -0,0 +1,162 @@
+"""asyncio client for the Sleeper API."""
+
+import asyncio
+import functools
+from collections.abc import Callable, Container, Iterable
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+from .api import DEFAULT_MAX_WORKERS, DEFAULT_TIMEOUT, SleeperAPI
+from .players import PlayerIndex
+
+
+class AsyncSleeperAPI:
+    """
+    Client for the Sleeper API with the same methods as SleeperAPI, as coroutines.
+
+    Requests run on a bounded pool of worker threads that share one pool of
+    keep-alive connections, so any number of tasks can await the client
+    while at most max_connections requests are open. Identical calls that
+    are already in flight (the same endpoint and final flag) are coalesced:
+    later callers await the first call's result without taking a worker
+    thread. Coalesced callers share the returned object, so treat results
+    as read-only.
+
+    Every SleeperAPI option (cache_dir, record_dir, replay_dir, profiler...)
+    is accepted and behaves the same way. Use it as an async context manager,
+    or call aclose() when done.
+
+    Args:
+        max_connections: Max requests open at once (and connection pool size)
+        timeout: Seconds to wait to connect or for more response data
+        api: Run calls on this existing client, sharing its caches, rate
+             limit and connections, instead of creating one (max_connections,
+             timeout and options are then ignored, and aclose() leaves the
+             client open)
+    """
+
+    def __init__(
+        self,
+        max_connections: int = DEFAULT_MAX_WORKERS,
+        timeout: float = DEFAULT_TIMEOUT,
+        api: SleeperAPI | None = None,
+        **options: Any,
+    ):
+        self._owns_api = api is None
+        self.api = (
+            api
+            if api is not None
+            else SleeperAPI(max_workers=max_connections, timeout=timeout, **options)
+        )
+        self._executor = ThreadPoolExecutor(
+            max_workers=self.api.max_workers, thread_name_prefix="sleeper-api"
+        )
+        self._in_flight: dict[tuple, asyncio.Future] = {}
+
+    async def __aenter__(self) -> "AsyncSleeperAPI":
+        return self
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        await self.aclose()
+
+    async def aclose(self) -> None:
+        """Wait for running requests, then release the threads (and connections, if owned)."""
+        await asyncio.get_running_loop().run_in_executor(
+            None, functools.partial(self._executor.shutdown, wait=True)
+        )
+        if self._owns_api and self.api.session is not None:
+            self.api.session.close()
+
+    async def _call(self, endpoint: str, final: bool, func: Callable, *args: Any) -> Any:
+        """Run a blocking client call on the pool, joining an identical call in flight."""
+        # The method is part of the key because the players database and its
+        # index are both built from /players
+        key = (func.__name__, endpoint, final)
+        future = self._in_flight.get(key)
+        if future is None:
+            loop = asyncio.get_running_loop()
+            future = loop.run_in_executor(self._executor, functools.partial(func, *args))
+            self._in_flight[key] = future
+
+            def done(finished: asyncio.Future) -> None:
+                if self._in_flight.get(key) is finished:
+                    del self._in_flight[key]
+
+            future.add_done_callback(done)
+        # Cancelling one caller must not cancel the request for the others
+        return await asyncio.shield(future)
+
+    async def get_user(self, username: str) -> dict:
+        """Get user info by username."""
+        return await self._call(f"/user/{username}", False, self.api.get_user, username)
+
+    async def get_leagues(self, user_id: str, sport: str, season: str) -> list[dict]:
+        """Get all leagues for a user in a given sport and season."""
+        return await self._call(
+            f"/user/{user_id}/leagues/{sport}/{season}",
+            False,
+            self.api.get_leagues,
+            user_id,
+            sport,
+            season,
+        )
+
+    async def get_league(self, league_id: str) -> dict:
+        """Get league details."""
+        return await self._call(f"/league/{league_id}", False, self.api.get_league, league_id)
+
+    async def get_rosters(self, league_id: str, final: bool = False) -> list[dict]:
+        """Get all rosters in a league (final=True if the league is complete)."""
+        return await self._call(
+            f"/league/{league_id}/rosters", final, self.api.get_rosters, league_id, final
+        )
+
+    async def get_users(self, league_id: str, final: bool = False) -> list[dict]:
+        """Get all users in a league (final=True if the league is complete)."""
+        return await self._call(
+            f"/league/{league_id}/users", final, self.api.get_users, league_id, final
+        )
+
+    async def get_matchups(
+        self, league_id: str, week: int, final: bool = False
+    ) -> list[dict]:
+        """Get matchups for a specific week (final=True if the week can no longer change)."""
+        return await self._call(
+            f"/league/{league_id}/matchups/{week}",
+            final,
+            self.api.get_matchups,
+            league_id,
+            week,
+            final,
+        )
+
+    async def get_season_matchups(
+        self,
+        league_id: str,
+        weeks: Iterable[int],
+        final_weeks: Container[int] = (),
+    ) -> dict[int, list[dict]]:
+        """Get matchups for several weeks concurrently, keyed by week."""
+        weeks = list(weeks)
+        results = await asyncio.gather(
+            *(self.get_matchups(league_id, week, final=week in final_weeks) for week in weeks)
+        )
+        return dict(zip(weeks, results))
+
+    async def get_state(self, sport: str = "nfl") -> dict:
+        """Get current state of the sport (week, season, etc.)."""
+        return await self._call(f"/state/{sport}", False, self.api.get_state, sport)
+
+    async def get_players(self, sport: str = "nfl", refresh: bool = False) -> dict:
+        """Get all players for a sport (see SleeperAPI.get_players)."""
+        return await self._call(
+            f"/players/{sport}", refresh, self.api.get_players, sport, refresh
+        )
+
+    async def get_player_index(
+        self, sport: str = "nfl", refresh: bool = False
+    ) -> PlayerIndex:
+        """Get a compact index of all players for a sport (see SleeperAPI.get_player_index)."""
+        return await self._call(
+            f"/players/{sport}", refresh, self.api.get_player_index, sport, refresh
+        )
@@ -0,0 +1,356 @@
+"""Run many reports from a job manifest in one process."""
+
+import argparse
+import asyncio
+import json
+import threading
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+
+from rich.console import Console
+from rich.table import Table
+
+from .api import SleeperAPI
+from .async_api import AsyncSleeperAPI
+from .cli import add_api_arguments, create_api
+from .export_pool import ExportPool, ExportTask
+from .grid import HTML_STYLES
+from .league import LeagueCache, build_all_team_reports, build_team_report
+from .rankings import RANKING_ENGINES
+
+# Default number of jobs run at once
+DEFAULT_JOBS = 4
+
+
+@dataclass
+class BatchJob:
+    """A single report request from the manifest."""
+
+    username: str
+    season: str | None = None
+    league: str | None = None
+    all_teams: bool = False
+    positions: list[str] | None = None
+
+    @property
+    def label(self) -> str:
+        """Short description used in the summary."""
+        parts = [self.username, self.season or "current", self.league or "all leagues"]
+        return " / ".join(parts)
+
+
+@dataclass
+class JobResult:
+    """Outcome of running a BatchJob."""
+
+    job: BatchJob
+    outputs: list[Path] = field(default_factory=list)
+    seconds: float = 0.0
+    error: str | None = None
+
+
+def load_manifest(path: Path) -> tuple[list[BatchJob], dict]:
+    """
+    Load a job manifest.
+
+    The manifest is a JSON object with a "jobs" list; each job has a
+    "username" and optional "season", "league", "all_teams" and "positions".
+    A job without a league renders every league the user is in. Optional
+    top-level "output_dir", "jobs_parallel", "processes" and "html_style"
+    provide defaults for the CLI options.
+
+    Returns:
+        Tuple of (jobs, options)
+    """
+    manifest = json.loads(path.read_text())
+    if isinstance(manifest, list):
+        manifest = {"jobs": manifest}
+
+    jobs = []
+    for i, entry in enumerate(manifest.get("jobs", []), 1):
+        if not entry.get("username"):
+            raise ValueError(f"Job {i} in {path} has no username")
+        jobs.append(
+            BatchJob(
+                username=entry["username"],
+                season=str(entry["season"]) if entry.get("season") else None,
+                league=str(entry["league"]) if entry.get("league") else None,
+                all_teams=bool(entry.get("all_teams", False)),
+                positions=entry.get("positions"),
+            )
+        )
+
+    options = {k: v for k, v in manifest.items() if k != "jobs"}
+    return jobs, options
+
+
+@dataclass
+class JobTarget:
+    """The user and leagues a job renders, resolved before any league is loaded."""
+
+    user_id: str
+    display_name: str
+    season: str
+    league_ids: list[str]
+
+
+async def resolve_job(
+    client: AsyncSleeperAPI, job: BatchJob, current_season: str
+) -> JobTarget:
+    """Look up a job's user and, unless the job names one, their leagues."""
+    season = job.season or current_season
+
+    user = await client.get_user(job.username)
+    if not user:
+        raise ValueError(f"User '{job.username}' not found")
+    user_id = user["user_id"]
+
+    if job.league:
+        league_ids = [job.league]
+    else:
+        user_leagues = await client.get_leagues(user_id, "nfl", season) or []
+        league_ids = [lg["league_id"] for lg in user_leagues]
+        if not league_ids:
+            raise ValueError(f"No NFL leagues found for {season}")
+
+    return JobTarget(user_id, user.get("display_name", job.username), season, league_ids)
+
+
+async def resolve_jobs(
+    api: SleeperAPI, jobs: list[BatchJob], current_season: str
+) -> list[JobTarget | Exception]:
+    """
+    Resolve every job at once on one event loop.
+
+    The lookups are small and independent, so they all go out together
+    (within the client's connection limit), and jobs for the same user
+    share their requests. A job that fails gets its exception in place of
+    a target.
+    """
+    async with AsyncSleeperAPI(api=api) as client:
+        return await asyncio.gather(
+            *(resolve_job(client, job, current_season) for job in jobs),
+            return_exceptions=True,
+        )
+
+
+def run_job(
+    leagues: LeagueCache,
+    job: BatchJob,
+    target: JobTarget,
+    output_dir: Path,
+    html_style: str = "inline",
+    pool: ExportPool | None = None,
+) -> list[Path]:
+    """
+    Render all outputs for a resolved job and return the files written.
+
+    Pages are written on `pool` when given, else in this thread.
+    """
+    if pool is None:
+        pool = ExportPool()
+    user_dir = output_dir / job.username
+    futures = []
+    for league_id in target.league_ids:
+        league = leagues.get(league_id)
+        name = f"{target.season}-{league_id}"
+
+        if job.all_teams:
+            reports = [r for r in build_all_team_reports(league) if r.results]
+            paths = [user_dir / name / f"{r.slug}.html" for r in reports]
+        else:
+            roster = next(
+                (r for r in league.rosters if r.get("owner_id") == target.user_id), None
+            )
+            if not roster or not roster.get("roster_id"):
+                raise ValueError(f"Could not find roster in league {league_id}")
+            reports = [build_team_report(league, roster, default_name=target.display_name)]
+            paths = [user_dir / f"{name}.html"]
+
+        for report, path in zip(reports, paths):
+            task = ExportTask.from_report(
+                report,
+                league.season or target.season,
+                league.max_week,
+                path,
+                position_filter=job.positions,
+                style=html_style,
+            )
+            futures.append(pool.submit(task))
+
+    return [future.result() for future in futures]
+
+
+def run_batch(
+    api: SleeperAPI,
+    jobs: list[BatchJob],
+    output_dir: Path,
+    parallel: int = DEFAULT_JOBS,
+    refresh_players: bool = False,
+    engine: str = "python",
+    html_style: str = "inline",
+    processes: int = 1,
+) -> list[JobResult]:
+    """
+    Run jobs on a worker pool sharing one API client, player index and league cache.
+
+    Every job's user and leagues are looked up first, concurrently, with
+    AsyncSleeperAPI; the jobs then load leagues and render on the pool.
+    Each league is kept only until the last job using it finishes, so a
+    long run holds just the leagues of the jobs in progress.
+
+    Args:
+        parallel: Jobs run at once (threads fetching and ranking)
+        processes: Processes writing HTML pages for all jobs (0 for one per CPU)
+    """
+    state = api.get_state("nfl")
+    current_season = str(state.get("season", "2024"))
+    # Load the player index once up front so workers never race to build it
+    api.get_player_index("nfl", refresh=refresh_players)
+    leagues = LeagueCache(api, state, engine=engine)
+    targets = asyncio.run(resolve_jobs(api, jobs, current_season))
+
+    # Jobs still to run for each league, so a league is dropped from the
+    # cache (and freed) as soon as the last job that needs it is done
+    pending = Counter(
+        league_id
+        for target in targets
+        if isinstance(target, JobTarget)
+        for league_id in set(target.league_ids)
+    )
+    pending_lock = threading.Lock()
+
+    def release(target: JobTarget) -> None:
+        for league_id in set(target.league_ids):
+            with pending_lock:
+                pending[league_id] -= 1
+                done = pending[league_id] == 0
+            if done:
+                leagues.discard(league_id)
+
+    def execute(job: BatchJob, target: JobTarget | Exception) -> JobResult:
+        result = JobResult(job)
+        start = time.perf_counter()
+        try:
+            if isinstance(target, Exception):
+                raise target
+            try:
+                result.outputs = run_job(leagues, job, target, output_dir, html_style, pool)
+            finally:
+                release(target)
+        except Exception as e:
+            result.error = str(e) or type(e).__name__
+        result.seconds = time.perf_counter() - start
+        return result
+
+    with ExportPool(processes) as pool:
+        with ThreadPoolExecutor(max_workers=max(1, parallel)) as executor:
+            return list(executor.map(execute, jobs, targets))
+
+
+def print_summary(results: list[JobResult], elapsed: float, console: Console) -> None:
+    """Print per-job timings and failures."""
+    table = Table(title="Batch Summary", header_style="bold")
+    table.add_column("Job", style="cyan")
+    table.add_column("Files", justify="right")
+    table.add_column("Time", justify="right")
+    table.add_column("Status")
+
+    for result in results:
+        status = f"[red]{result.error}[/red]" if result.error else "[green]ok[/green]"
+        table.add_row(
+            result.job.label,
+            str(len(result.outputs)),
+            f"{result.seconds:.2f}s",
+            status,
+        )
+
+    console.print(table)
+    failed = sum(1 for r in results if r.error)
+    files = sum(len(r.outputs) for r in results)
+    console.print(
+        f"{len(results)} jobs, {files} files, {failed} failed in {elapsed:.2f}s"
+    )
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for `sleeper-pixels batch`."""
+    parser = argparse.ArgumentParser(
+        prog="sleeper-pixels batch",
+        description="Render HTML grids for many users and leagues from a job manifest",
+    )
+    parser.add_argument("manifest", type=Path, help="JSON job manifest")
+    parser.add_argument(
+        "--output",
+        "-o",
+        type=Path,
+        default=None,
+        help="Output directory (default: manifest output_dir or ./reports)",
+    )
+    parser.add_argument(
+        "--jobs",
+        "-j",
+        type=int,
+        default=None,
+        help=f"Jobs to run in parallel (default: manifest jobs_parallel or {DEFAULT_JOBS})",
+    )
+    parser.add_argument(
+        "--processes",
+        "-P",
+        type=int,
+        default=None,
+        help="Processes writing HTML pages, 0 for one per CPU (default: manifest processes or 1)",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=RANKING_ENGINES,
+        default="python",
+        help="Ranking engine; numpy batches whole seasons (requires numpy)",
+    )
+    parser.add_argument(
+        "--html-style",
+        choices=HTML_STYLES,
+        default=None,
+        help="HTML output style (default: manifest html_style or inline)",
+    )
+    add_api_arguments(parser)
+
+    args = parser.parse_args(argv)
+    console = Console()
+
+    try:
+        jobs, options = load_manifest(args.manifest)
+        output_dir = args.output or Path(options.get("output_dir", "reports"))
+        parallel = args.jobs or int(options.get("jobs_parallel", DEFAULT_JOBS))
+        processes = (
+            args.processes if args.processes is not None else int(options.get("processes", 1))
+        )
+        html_style = args.html_style or options.get("html_style", "inline")
+        if html_style not in HTML_STYLES:
+            raise ValueError(f"Unknown html_style in manifest: {html_style}")
+
+        console.print(f"[dim]Running {len(jobs)} jobs...[/dim]")
+        start = time.perf_counter()
+        results = run_batch(
+            # No dedupe: it would keep every response of the run in memory,
+            # and each league is loaded once through the league cache anyway
+            create_api(args),
+            jobs,
+            output_dir,
+            parallel=parallel,
+            refresh_players=args.refresh_players,
+            engine=args.engine,
+            html_style=html_style,
+            processes=processes,
+        )
+        print_summary(results, time.perf_counter() - start, console)
+        return 1 if any(r.error for r in results) else 0
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Cancelled.[/yellow]")
+        return 1
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return 1
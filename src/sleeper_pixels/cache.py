@@ -0,0 +1,68 @@
+"""On-disk cache helpers."""
+
+import json
+import os
+import tempfile
+from collections.abc import Iterable, Iterator
+from pathlib import Path
+from typing import Any
+
+
+def default_cache_dir() -> Path:
+    """Get the default cache directory (respects XDG_CACHE_HOME)."""
+    base = os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache"
+    return Path(base) / "sleeper-pixels"
+
+
+def read_json(path: Path) -> Any | None:
+    """Read a JSON file, returning None if it is missing or corrupt."""
+    try:
+        with path.open("rb") as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def write_bytes(path: Path, data: bytes) -> None:
+    """Atomically write bytes so readers never see a partial file."""
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.write(data)
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def tee_to_file(path: Path, chunks: Iterable[bytes]) -> Iterator[bytes]:
+    """
+    Yield chunks while writing them to a file.
+
+    The file is replaced atomically once every chunk has been written, and
+    left untouched if the consumer stops early.
+    """
+    path.parent.mkdir(parents=True, exist_ok=True)
+    fd, tmp_name = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            for chunk in chunks:
+                f.write(chunk)
+                yield chunk
+        os.replace(tmp_name, path)
+    except BaseException:
+        os.unlink(tmp_name)
+        raise
+
+
+def read_chunks(path: Path, size: int = 64 * 1024) -> Iterator[bytes]:
+    """Yield a file's contents in chunks."""
+    with path.open("rb") as f:
+        while chunk := f.read(size):
+            yield chunk
+
+
+def write_json(path: Path, data: Any) -> None:
+    """Atomically write data as JSON."""
+    write_bytes(path, json.dumps(data).encode())
@@ -1,21 +1,78 @@
 """Command-line interface for sleeper-pixel-performance."""
 
 import argparse
+import contextlib
 import sys
 from pathlib import Path
+from typing import TYPE_CHECKING, TextIO
+
+from .api import (
+    DEFAULT_MAX_WORKERS,
+    DEFAULT_PLAYERS_TTL,
+    DEFAULT_RATE_LIMIT,
+    DEFAULT_RETRIES,
+    DEFAULT_TIMEOUT,
+    SleeperAPI,
+)
+from .cache import default_cache_dir
+from .grid import (
+    GRID_RENDERERS,
+    HTML_STYLES,
+    iter_combined_html,
+    iter_seasons_html,
+    render_pixel_grid,
+    write_html,
+)
+from .history import SeasonArchive, load_history, merge_seasons, parse_seasons
+from .league import (
+    TeamReport,
+    build_all_team_reports,
+    build_team_report,
+    iter_team_reports,
+    load_league,
+)
+from .profiling import Profiler, stage
+from .rankings import RANKING_ENGINES
+
+# Rich (and requests, via SleeperAPI) are loaded only once a command needs
+# them, so --help and argument errors return without importing either
+if TYPE_CHECKING:
+    from rich.console import Console
+
+
+# Shown at the end of --help; the subcommands are dispatched before argparse runs
+COMMANDS_HELP = """\
+commands:
+  batch MANIFEST  render many users and leagues from a job manifest
+                  (see 'batch --help')
+  serve           serve HTML grids over HTTP (see 'serve --help')
+
+A first argument of 'batch' or 'serve' runs that command. To look up a
+user with one of those names, start with '--': %(prog)s -- serve --week 4
+"""
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Main entry point for the CLI."""
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["--"]:
+        # Only marks that a username of "batch" or "serve" follows
+        argv = argv[1:]
+    elif argv[:1] == ["batch"]:
+        from .batch import main as batch_main
 
-from rich.console import Console
-from rich.prompt import Prompt
-
-from .api import SleeperAPI
-from .grid import export_html, render_pixel_grid
-from .rankings import build_roster_performance
+        return batch_main(argv[1:])
+    elif argv[:1] == ["serve"]:
+        from .serve import main as serve_main
 
+        return serve_main(argv[1:])
 
-def main() -> int:
-    """Main entry point for the CLI."""
     parser = argparse.ArgumentParser(
-        description="Visualize fantasy football roster performance with pixel grids"
+        description="Visualize fantasy football roster performance with pixel grids",
+        usage="%(prog)s [options] username\n       %(prog)s {batch,serve} ...",
+        epilog=COMMANDS_HELP,
+        formatter_class=argparse.RawDescriptionHelpFormatter,
     )
     parser.add_argument("username", help="Sleeper username")
     parser.add_argument(
@@ -23,6 +80,19 @@ def main() -> int:
         default=None,
         help="NFL season year (default: current season)",
     )
+    parser.add_argument(
+        "--seasons",
+        metavar="RANGE",
+        help=(
+            "Show several seasons, e.g. 2021-2025, following the league back "
+            "through its previous seasons"
+        ),
+    )
+    parser.add_argument(
+        "--career-grid",
+        action="store_true",
+        help="With --seasons, draw one long grid instead of one per season",
+    )
     parser.add_argument(
         "--league",
         default=None,
@@ -50,14 +120,98 @@ def main() -> int:
     parser.add_argument(
         "--html",
         metavar="FILE",
-        help="Export to HTML file instead of terminal output",
+        help="Export to HTML file instead of terminal output ('-' for stdout)",
+    )
+    parser.add_argument(
+        "--renderer",
+        choices=GRID_RENDERERS,
+        default="auto",
+        help=(
+            "Terminal output: auto writes ANSI rows directly on color terminals, "
+            "rich always lays out a Rich table (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--html-style",
+        choices=HTML_STYLES,
+        default="inline",
+        help=(
+            "HTML output: inline styles per cell, compact CSS tier classes, "
+            "or data (JSON drawn in the browser) (default: %(default)s)"
+        ),
+    )
+    parser.add_argument(
+        "--all-teams",
+        action="store_true",
+        help=(
+            "Render every roster in the league (--html then names a directory, "
+            "or a single .html file or '-' for one combined page)"
+        ),
+    )
+    parser.add_argument(
+        "--processes",
+        type=int,
+        default=1,
+        metavar="N",
+        help="With --all-teams --html DIR, write pages on N processes (0 for one per CPU)",
+    )
+    parser.add_argument(
+        "--watch",
+        type=float,
+        metavar="SECONDS",
+        help="Keep the grid on screen, polling the live week every SECONDS",
+    )
+    parser.add_argument(
+        "--engine",
+        choices=RANKING_ENGINES,
+        default="python",
+        help="Ranking engine; numpy batches whole seasons (requires numpy)",
+    )
+    parser.add_argument(
+        "--profile",
+        action="store_true",
+        help="Print time spent per stage and per API endpoint",
+    )
+    parser.add_argument(
+        "--profile-json",
+        type=Path,
+        metavar="FILE",
+        help="Write every request and stage timing to a JSON file (implies --profile)",
+    )
+    parser.add_argument(
+        "--profile-trace",
+        type=Path,
+        metavar="FILE",
+        help="Write timings as a Chrome trace, for chrome://tracing or Perfetto",
+    )
+    add_api_arguments(parser)
+
+    args = parser.parse_args(argv)
+    if args.watch is not None and (args.html or args.all_teams):
+        parser.error("--watch cannot be combined with --html or --all-teams")
+    if args.watch is not None and args.watch <= 0:
+        parser.error("--watch interval must be positive")
+    if args.seasons:
+        if args.season or args.week or args.all_teams or args.watch is not None:
+            parser.error("--seasons cannot be combined with --season, --week, --all-teams or --watch")
+        if args.html and not is_html_file(args.html):
+            parser.error("--seasons writes one page; --html must be a .html file or '-'")
+        try:
+            args.seasons = parse_seasons(args.seasons)
+        except ValueError as e:
+            parser.error(str(e))
+    elif args.career_grid:
+        parser.error("--career-grid requires --seasons")
+    from rich.console import Console
+
+    # Keep status messages out of HTML streamed to stdout
+    console = Console(stderr=args.html == "-")
+    profiler = (
+        Profiler() if args.profile or args.profile_json or args.profile_trace else None
     )
-
-    args = parser.parse_args()
-    console = Console()
 
     try:
-        run(args, console)
+        run(args, console, profiler)
         return 0
     except KeyboardInterrupt:
         console.print("\n[yellow]Cancelled.[/yellow]")
@@ -65,24 +219,129 @@ def main() -> int:
     except Exception as e:
         console.print(f"[red]Error: {e}[/red]")
         return 1
+    finally:
+        if profiler is not None:
+            report_profile(profiler, args, console)
+
 
+def report_profile(profiler: Profiler, args: argparse.Namespace, console: "Console") -> None:
+    """Print the profile summary and write any requested profile files."""
+    console.print()
+    profiler.render(console)
+    if args.profile_json:
+        profiler.write_json(args.profile_json)
+        console.print(f"[dim]Profile written to {args.profile_json}[/dim]")
+    if args.profile_trace:
+        profiler.write_chrome_trace(args.profile_trace)
+        console.print(f"[dim]Trace written to {args.profile_trace}[/dim]")
 
-def run(args: argparse.Namespace, console: Console) -> None:
-    """Run the visualization."""
-    api = SleeperAPI()
+
+def add_api_arguments(parser: argparse.ArgumentParser) -> None:
+    """Add options controlling the API client and its caches."""
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=DEFAULT_MAX_WORKERS,
+        help=f"Max concurrent API requests (default: {DEFAULT_MAX_WORKERS})",
+    )
+    parser.add_argument(
+        "--timeout",
+        type=float,
+        default=DEFAULT_TIMEOUT,
+        metavar="SECONDS",
+        help="Give up on an API request that stalls this long (default: %(default)g)",
+    )
+    parser.add_argument(
+        "--rate-limit",
+        type=float,
+        default=DEFAULT_RATE_LIMIT,
+        metavar="PER_SECOND",
+        help="Max sustained API requests per second, 0 for no limit (default: %(default).3g)",
+    )
+    parser.add_argument(
+        "--retries",
+        type=int,
+        default=DEFAULT_RETRIES,
+        metavar="N",
+        help="Retries for throttled, 5xx or dropped API requests (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--cache-dir",
+        type=Path,
+        default=default_cache_dir(),
+        help="Directory for cached API data (default: %(default)s)",
+    )
+    parser.add_argument(
+        "--players-ttl",
+        type=float,
+        default=DEFAULT_PLAYERS_TTL / 3600,
+        metavar="HOURS",
+        help="Hours to reuse the cached player database before revalidating (default: %(default)g)",
+    )
+    parser.add_argument(
+        "--refresh-players",
+        action="store_true",
+        help="Ignore the cached player database and download it again",
+    )
+    archive = parser.add_mutually_exclusive_group()
+    archive.add_argument(
+        "--record",
+        type=Path,
+        metavar="DIR",
+        help="Save every API response to an archive directory",
+    )
+    archive.add_argument(
+        "--replay",
+        type=Path,
+        metavar="DIR",
+        help="Serve API responses from an archive directory, with no network",
+    )
+
+
+def create_api(
+    args: argparse.Namespace, profiler: Profiler | None = None, dedupe: bool = False
+) -> SleeperAPI:
+    """
+    Create an API client from parsed command-line options.
+
+    Pass dedupe=True for one-shot runs, where a response fetched once can be
+    reused for the rest of the run.
+    """
+    return SleeperAPI(
+        max_workers=args.workers,
+        timeout=args.timeout,
+        rate_limit=args.rate_limit or None,
+        retries=args.retries,
+        dedupe=dedupe,
+        cache_dir=args.cache_dir,
+        players_ttl=args.players_ttl * 3600,
+        record_dir=args.record,
+        replay_dir=args.replay,
+        profiler=profiler,
+    )
+
+
+def run(
+    args: argparse.Namespace, console: "Console", profiler: Profiler | None = None
+) -> None:
+    """Run the visualization, timing each stage if a profiler is given."""
+    # Watching polls the same endpoints for changes, so only dedupe one-shot runs
+    api = create_api(args, profiler, dedupe=args.watch is None)
 
     # Get current state
     console.print("[dim]Fetching NFL state...[/dim]")
-    state = api.get_state("nfl")
+    with stage(profiler, "fetch"):
+        state = api.get_state("nfl")
     current_season = str(state.get("season", "2024"))
-    season = args.season or current_season
+    season = args.season or (args.seasons[-1] if args.seasons else current_season)
 
-    # We'll determine max_week after fetching matchups (to find weeks with data)
+    # load_league determines max_week from matchups (to find weeks with data)
     requested_week = args.week
 
     # Get user
     console.print(f"[dim]Looking up user {args.username}...[/dim]")
-    user = api.get_user(args.username)
+    with stage(profiler, "fetch"):
+        user = api.get_user(args.username)
     if not user:
         raise ValueError(f"User '{args.username}' not found")
     user_id = user["user_id"]
@@ -90,7 +349,8 @@ def run(args: argparse.Namespace, console: Console) -> None:
 
     # Get leagues
     console.print(f"[dim]Fetching {season} leagues...[/dim]")
-    leagues = api.get_leagues(user_id, "nfl", season)
+    with stage(profiler, "fetch"):
+        leagues = api.get_leagues(user_id, "nfl", season)
     if not leagues:
         raise ValueError(f"No NFL leagues found for {season}")
 
@@ -99,130 +359,256 @@ def run(args: argparse.Namespace, console: Console) -> None:
     if not league_id:
         league_id = select_league(leagues, console)
 
-    league = api.get_league(league_id)
-    league_name = league.get("name", "Unknown League")
-
-    # Get rosters and users
-    console.print("[dim]Fetching rosters...[/dim]")
-    rosters = api.get_rosters(league_id)
-    users = api.get_users(league_id)
-
-    # Build user_id -> team_name mapping
-    user_team_names: dict[str, str] = {}
-    for u in users:
-        uid = u.get("user_id")
-        metadata = u.get("metadata", {})
-        team_name = metadata.get("team_name") or u.get("display_name", uid)
-        user_team_names[uid] = team_name
-
-    # Fetch matchups for all weeks (up to 17) and detect which have data
-    console.print("[dim]Fetching matchups...[/dim]")
-    weekly_matchups: dict[int, list[dict]] = {}
-    for week in range(1, 18):
-        matchups = api.get_matchups(league_id, week)
-        # Check if this week has actual scoring data
-        has_data = any(
-            m.get("players_points") for m in matchups
-        ) if matchups else False
-        if has_data:
-            weekly_matchups[week] = matchups
-
-    # Determine max week from actual data
-    if requested_week:
-        max_week = requested_week
-    elif weekly_matchups:
-        max_week = max(weekly_matchups.keys())
-    else:
-        max_week = 1
-
-    console.print(f"[dim]Found data for weeks 1-{max_week}[/dim]")
-
-    # Get player database
-    console.print("[dim]Loading player database...[/dim]")
-    players_db = api.get_players("nfl")
-
-    def get_all_season_players(roster_id: int) -> list[str]:
-        """Get all players who appeared on a roster throughout the season."""
-        all_players: set[str] = set()
-        for week_matchups in weekly_matchups.values():
-            for matchup in week_matchups:
-                if matchup.get("roster_id") == roster_id:
-                    players = matchup.get("players") or []
-                    all_players.update(players)
-        return list(all_players)
-
-    def get_roster_weeks(roster_id: int) -> dict[str, set[int]]:
-        """Get which weeks each player was on the roster."""
-        player_weeks: dict[str, set[int]] = {}
-        for week, week_matchups in weekly_matchups.items():
-            for matchup in week_matchups:
-                if matchup.get("roster_id") == roster_id:
-                    players = matchup.get("players") or []
-                    for player_id in players:
-                        if player_id not in player_weeks:
-                            player_weeks[player_id] = set()
-                        player_weeks[player_id].add(week)
-        return player_weeks
+    if args.seasons:
+        run_history(args, api, league_id, user_id, display_name, state, console, profiler)
+        return
+
+    league = load_league(
+        api,
+        league_id,
+        max_week=requested_week,
+        refresh_players=args.refresh_players,
+        console=console,
+        state=state,
+        engine=args.engine,
+    )
+
+    if args.all_teams:
+        console.print("[dim]Calculating positional rankings...[/dim]")
+        if args.html and is_html_file(args.html):
+            # One page, built a team at a time as it is written
+            reports = (r for r in iter_team_reports(league) if r.results)
+            grids = ((r.results, r.team_name, r.roster_weeks) for r in reports)
+            chunks = iter_combined_html(
+                f"{league.name} - {season} Season Performance",
+                grids,
+                season,
+                league.max_week,
+                position_filter=args.positions,
+                style=args.html_style,
+            )
+            with stage(profiler, "export"), open_html_output(args.html) as output:
+                output.writelines(chunks)
+            if args.html != "-":
+                console.print(f"[green]Exported to {args.html}[/green]")
+            console.print(f"[dim]League: {league.name}[/dim]")
+            return
+
+        with stage(profiler, "rank"):
+            reports = [r for r in build_all_team_reports(league) if r.results]
+        if not reports:
+            raise ValueError("No player data found in matchups")
+        if args.html:
+            from .export_pool import ExportPool, ExportTask
+
+            output_dir = Path(args.html)
+            output_dir.mkdir(parents=True, exist_ok=True)
+            tasks = (
+                ExportTask.from_report(
+                    report,
+                    season,
+                    league.max_week,
+                    output_dir / f"{report.slug}.html",
+                    position_filter=args.positions,
+                    style=args.html_style,
+                )
+                for report in reports
+            )
+            with stage(profiler, "export"), ExportPool(args.processes) as pool:
+                for _ in pool.map(tasks):
+                    pass
+            console.print(f"[green]Exported {len(reports)} teams to {output_dir}[/green]")
+        else:
+            with stage(profiler, "render"):
+                for report in reports:
+                    render_report(report, season, league.max_week, console, args)
+        console.print(f"[dim]League: {league.name}[/dim]")
+        return
 
     # Find user's roster
     user_roster = None
-    team_name = display_name
-    roster_id = None
-    for roster in rosters:
+    for roster in league.rosters:
         if roster.get("owner_id") == user_id:
             user_roster = roster
-            roster_id = roster.get("roster_id")
-            team_name = user_team_names.get(user_id, display_name)
             break
 
-    if not user_roster or not roster_id:
+    if not user_roster or not user_roster.get("roster_id"):
         raise ValueError("Could not find your roster in this league")
 
-    # Get all players from matchup history (not just current roster)
-    roster_players = get_all_season_players(roster_id)
-    if not roster_players:
-        raise ValueError("No player data found in matchups")
+    if args.watch is not None:
+        from .watch import watch_team
 
-    # Get roster membership by week (to show when players joined/left)
-    roster_weeks = get_roster_weeks(roster_id)
+        watch_team(
+            api,
+            league,
+            user_roster,
+            args.watch,
+            console,
+            default_name=display_name,
+            show_points=args.show_points,
+            position_filter=args.positions,
+            state=state,
+            renderer=args.renderer,
+        )
+        return
 
-    # Build performance data (only for weeks player was on roster)
     console.print("[dim]Calculating positional rankings...[/dim]")
-    results = build_roster_performance(
-        roster_players, weekly_matchups, players_db, max_week, roster_weeks
-    )
+    with stage(profiler, "rank"):
+        report = build_team_report(league, user_roster, default_name=display_name)
+    if not report.roster_weeks:
+        raise ValueError("No player data found in matchups")
 
     if args.html:
         # Export to HTML
-        output_path = Path(args.html)
-        export_html(
-            results,
-            team_name,
-            season,
-            max_week,
-            output_path,
-            position_filter=args.positions,
-            roster_weeks=roster_weeks,
-        )
-        console.print(f"[green]Exported to {output_path}[/green]")
+        with stage(profiler, "export"), open_html_output(args.html) as output:
+            write_html(
+                output,
+                report.results,
+                report.team_name,
+                season,
+                league.max_week,
+                position_filter=args.positions,
+                roster_weeks=report.roster_weeks,
+                style=args.html_style,
+            )
+        if args.html != "-":
+            console.print(f"[green]Exported to {args.html}[/green]")
     else:
         # Render to terminal
-        render_pixel_grid(
-            results,
-            team_name,
-            season,
-            max_week,
-            console,
-            show_points=args.show_points,
+        with stage(profiler, "render"):
+            render_report(report, season, league.max_week, console, args)
+
+    console.print(f"[dim]League: {league.name}[/dim]")
+
+
+def run_history(
+    args: argparse.Namespace,
+    api: SleeperAPI,
+    league_id: str,
+    user_id: str,
+    display_name: str,
+    state: dict,
+    console: "Console",
+    profiler: Profiler | None = None,
+) -> None:
+    """Render the user's team across every season in --seasons."""
+    archive = SeasonArchive.under(api.cache_dir) if api.cache_dir else None
+    histories = load_history(
+        api,
+        league_id,
+        args.seasons,
+        archive=archive,
+        refresh_players=args.refresh_players,
+        console=console,
+        state=state,
+        engine=args.engine,
+    )
+
+    teams = [
+        (history, team)
+        for history in histories
+        if (team := history.team_for(user_id)) is not None and team.results
+    ]
+    if not teams:
+        raise ValueError("No player data found for your team in these seasons")
+    found = {history.season for history, _ in teams}
+    missing = [season for season in args.seasons if season not in found]
+    if missing:
+        console.print(f"[dim]No data for your team in {', '.join(missing)}[/dim]")
+
+    span = f"{teams[0][0].season}-{teams[-1][0].season}"
+    team_name = teams[-1][1].team_name or display_name
+
+    if args.career_grid:
+        results, roster_weeks, total_weeks = merge_seasons(
+            (team, history.max_week) for history, team in teams
+        )
+        if args.html:
+            with stage(profiler, "export"), open_html_output(args.html) as output:
+                write_html(
+                    output,
+                    results,
+                    team_name,
+                    span,
+                    total_weeks,
+                    position_filter=args.positions,
+                    roster_weeks=roster_weeks,
+                    style=args.html_style,
+                )
+        else:
+            with stage(profiler, "render"):
+                render_pixel_grid(
+                    results,
+                    team_name,
+                    span,
+                    total_weeks,
+                    console,
+                    show_points=args.show_points,
+                    position_filter=args.positions,
+                    roster_weeks=roster_weeks,
+                    renderer=args.renderer,
+                )
+    elif args.html:
+        grids = (
+            (team.results, team.team_name, history.season, history.max_week, team.roster_weeks)
+            for history, team in teams
+        )
+        chunks = iter_seasons_html(
+            f"{team_name} - {span} Seasons",
+            grids,
             position_filter=args.positions,
-            roster_weeks=roster_weeks,
+            style=args.html_style,
         )
+        with stage(profiler, "export"), open_html_output(args.html) as output:
+            output.writelines(chunks)
+    else:
+        with stage(profiler, "render"):
+            for history, team in teams:
+                render_report(team, history.season, history.max_week, console, args)
+
+    if args.html and args.html != "-":
+        console.print(f"[green]Exported to {args.html}[/green]")
+    console.print(f"[dim]League: {teams[-1][0].name}[/dim]")
+
+
+def render_report(
+    report: TeamReport,
+    season: str,
+    max_week: int,
+    console: "Console",
+    args: argparse.Namespace,
+) -> None:
+    """Render a team's pixel grid to the terminal."""
+    render_pixel_grid(
+        report.results,
+        report.team_name,
+        season,
+        max_week,
+        console,
+        show_points=args.show_points,
+        position_filter=args.positions,
+        roster_weeks=report.roster_weeks,
+        renderer=args.renderer,
+    )
+
+
+def is_html_file(target: str) -> bool:
+    """Check whether an --html target names a single page rather than a directory."""
+    return target == "-" or target.lower().endswith((".html", ".htm"))
 
-    console.print(f"[dim]League: {league_name}[/dim]")
 
+def open_html_output(target: str) -> contextlib.AbstractContextManager[TextIO]:
+    """Open an --html target for streaming, where '-' is stdout."""
+    if target == "-":
+        # Don't let the with-block close stdout
+        return contextlib.nullcontext(sys.stdout)
+    return open(target, "w", encoding="utf-8")
 
-def select_league(leagues: list[dict], console: Console) -> str:
+
+def select_league(leagues: list[dict], console: "Console") -> str:
     """Prompt user to select a league."""
+    from rich.prompt import Prompt
+
     console.print("\n[bold]Select a league:[/bold]")
     for i, league in enumerate(leagues, 1):
         name = league.get("name", "Unknown")
@@ -0,0 +1,126 @@
+"""Write many HTML grids in parallel worker processes."""
+
+import multiprocessing
+import os
+from collections.abc import Iterable, Iterator
+from concurrent.futures import Future, ProcessPoolExecutor
+from dataclasses import dataclass
+from pathlib import Path
+
+from .grid import export_html
+from .league import TeamReport
+from .results import SeasonResults, pack_weeks, unpack_weeks
+
+
+@dataclass(frozen=True, slots=True)
+class ExportTask:
+    """One HTML grid to write, in the compact form sent to a worker process."""
+
+    results: bytes  # SeasonResults.to_bytes()
+    roster_weeks: dict[str, int]  # player_id -> bitmask of weeks on the roster
+    team_name: str
+    season: str
+    max_week: int
+    path: Path
+    position_filter: list[str] | None = None
+    style: str = "inline"
+
+    @classmethod
+    def from_report(
+        cls,
+        report: TeamReport,
+        season: str,
+        max_week: int,
+        path: Path,
+        position_filter: list[str] | None = None,
+        style: str = "inline",
+    ) -> "ExportTask":
+        """Pack a team's results for export."""
+        return cls(
+            results=report.results.to_bytes(),
+            roster_weeks={
+                player_id: pack_weeks(weeks) for player_id, weeks in report.roster_weeks.items()
+            },
+            team_name=report.team_name,
+            season=season,
+            max_week=max_week,
+            path=path,
+            position_filter=position_filter,
+            style=style,
+        )
+
+
+def run_export(task: ExportTask) -> Path:
+    """Write one task's HTML file and return its path."""
+    task.path.parent.mkdir(parents=True, exist_ok=True)
+    export_html(
+        SeasonResults.from_bytes(task.results),
+        task.team_name,
+        task.season,
+        task.max_week,
+        task.path,
+        position_filter=task.position_filter,
+        roster_weeks={
+            player_id: unpack_weeks(mask) for player_id, mask in task.roster_weeks.items()
+        },
+        style=task.style,
+    )
+    return task.path
+
+
+class ExportPool:
+    """
+    Writes HTML grids on a pool of worker processes.
+
+    Each team's grid is independent, so large exports can use every core.
+    Tasks carry results as compact bytes rather than Python objects, and
+    outputs come back in the order tasks were given. Workers are spawned
+    rather than forked, so the pool is safe to use from threads. With one
+    process, tasks are written in the calling thread with no pool.
+
+    Use it as a context manager, or call close() when done.
+
+    Args:
+        processes: Worker processes (0 for one per CPU)
+    """
+
+    def __init__(self, processes: int = 1):
+        self.processes = processes if processes > 0 else os.cpu_count() or 1
+        self._executor = (
+            ProcessPoolExecutor(
+                max_workers=self.processes, mp_context=multiprocessing.get_context("spawn")
+            )
+            if self.processes > 1
+            else None
+        )
+
+    def __enter__(self) -> "ExportPool":
+        return self
+
+    def __exit__(self, *exc_info: object) -> None:
+        self.close()
+
+    def close(self) -> None:
+        """Wait for running tasks, then stop the workers."""
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+
+    def submit(self, task: ExportTask) -> "Future[Path]":
+        """Write one grid, returning a future for its path."""
+        if self._executor is not None:
+            return self._executor.submit(run_export, task)
+        future: Future[Path] = Future()
+        try:
+            future.set_result(run_export(task))
+        except Exception as e:
+            future.set_exception(e)
+        return future
+
+    def map(self, tasks: Iterable[ExportTask]) -> Iterator[Path]:
+        """Write every grid, yielding paths in task order."""
+        if self._executor is None:
+            return map(run_export, tasks)
+        tasks = list(tasks)
+        # Batch small tasks so each round trip to a worker carries several
+        chunksize = max(1, len(tasks) // (self.processes * 4))
+        return self._executor.map(run_export, tasks, chunksize=chunksize)
@@ -0,0 +1,188 @@
+"""Pixel grid layout that skips rich.Table for large or frequently redrawn grids."""
+
+from collections.abc import Iterator
+
+from rich.cells import cell_len
+from rich.color import ColorSystem
+from rich.console import Console, ConsoleOptions
+from rich.measure import Measurement
+from rich.segment import Segment
+from rich.style import Style
+
+from .grid import TIER_COLORS, TIER_SYMBOLS, _prepare_player_data
+from .rankings import PlayerWeekResult
+from .results import SeasonResults
+
+# Minimum width of the player column, as in build_pixel_table
+PLAYER_COLUMN_WIDTH = 18
+
+# Console color systems the ANSI writer handles
+COLOR_SYSTEMS = {
+    "standard": ColorSystem.STANDARD,
+    "256": ColorSystem.EIGHT_BIT,
+    "truecolor": ColorSystem.TRUECOLOR,
+}
+
+# A line of (text, style) pieces
+Line = list[tuple[str, str | None]]
+
+
+class PixelGrid:
+    """
+    A pixel grid laid out as fixed-width lines of (text, style) pieces.
+
+    Matches the layout of the table from build_pixel_table, but every column
+    width is known up front, so nothing is measured or wrapped. Print it
+    with Rich like any renderable (e.g. inside Live), or write() it to a
+    terminal as precomputed ANSI text.
+    """
+
+    def __init__(self, lines: list[Line], width: int, title_fits: bool = True):
+        self.lines = lines
+        self.width = width
+        # Rich wraps a title wider than the table; this layout does not
+        self.title_fits = title_fits
+
+    def __rich_console__(
+        self, console: Console, options: ConsoleOptions
+    ) -> Iterator[Segment]:
+        for line in self.lines:
+            for text, style in line:
+                yield Segment(text, Style.parse(style) if style else None)
+            yield Segment.line()
+
+    def __rich_measure__(self, console: Console, options: ConsoleOptions) -> Measurement:
+        return Measurement(self.width, self.width)
+
+    def fits(self, console: Console) -> bool:
+        """Check whether the grid lays out exactly like the Rich table on a console."""
+        return self.title_fits and self.width <= console.width
+
+    def to_ansi(self, color_system: ColorSystem) -> str:
+        """Render as text with ANSI color codes, styling each distinct piece once."""
+        rendered: dict[tuple[str, str | None], str] = {}
+        parts = []
+        for line in self.lines:
+            for piece in line:
+                ansi = rendered.get(piece)
+                if ansi is None:
+                    text, style = piece
+                    ansi = Style.parse(style).render(text, color_system=color_system) if style else text
+                    rendered[piece] = ansi
+                parts.append(ansi)
+            parts.append("\n")
+        return "".join(parts)
+
+    def can_write(self, console: Console) -> bool:
+        """
+        Check whether write() can handle a console.
+
+        Piped output, recording consoles, legacy Windows and terminals too
+        narrow for the grid should print through Rich instead.
+        """
+        return (
+            COLOR_SYSTEMS.get(console.color_system or "") is not None
+            and console.is_terminal
+            and not console.record
+            and not console.legacy_windows
+            and self.fits(console)
+        )
+
+    def write(self, console: Console) -> None:
+        """Write the grid straight to a color terminal, bypassing Rich's rendering."""
+        color_system = COLOR_SYSTEMS[console.color_system or ""]
+        console.file.write(self.to_ansi(color_system))
+        console.file.flush()
+
+
+def build_pixel_grid(
+    results: SeasonResults | list[PlayerWeekResult],
+    team_name: str,
+    season: str,
+    max_week: int,
+    show_points: bool = False,
+    position_filter: list[str] | None = None,
+    roster_weeks: dict[str, set[int]] | None = None,
+) -> PixelGrid | None:
+    """Lay out the pixel grid, or return None if there is nothing to show."""
+    season_results, sorted_players = _prepare_player_data(results, position_filter)
+
+    if not sorted_players:
+        return None
+
+    col_width = 5 if show_points else 2
+    labels = [(position, f" {name[:15]}") for _, (name, position) in sorted_players]
+    player_width = max(
+        PLAYER_COLUMN_WIDTH,
+        *(cell_len(position) + cell_len(name) for position, name in labels),
+    )
+    # Edge, player column, then a separator and cell per week, then edge
+    width = 1 + player_width + (1 + col_width) * max_week + 1
+
+    title = f"{team_name} - {season} Season Performance"
+    title_width = cell_len(title)
+    title_left = max(0, (width - title_width) // 2)
+    title_right = max(0, width - title_width - title_left)
+    blank: Line = [(" " * width, None)]
+
+    lines: list[Line] = [
+        [(" " * title_left, None), (title, "italic"), (" " * title_right, None)],
+        blank,
+    ]
+
+    # Header
+    header: Line = [(" ", None), ("Player".ljust(player_width), "bold")]
+    for week in range(1, max_week + 1):
+        header.append((" ", None))
+        header.append((_center(str(week), col_width), "bold"))
+    header.append((" ", None))
+    lines.append(header)
+    lines.append([(" " + "─" * (width - 2) + " ", None)])
+
+    # Cells that look the same every time they appear
+    no_data = _cell("·", "dim", col_width)
+    off_roster = [(" " * (col_width + 1), None)]
+    tier_cells = {
+        tier: _cell(TIER_SYMBOLS[tier], TIER_COLORS[tier], col_width)
+        for tier in TIER_COLORS
+    }
+
+    cells = season_results.matrix(max_week)
+    for (player, _), (position, name) in zip(sorted_players, labels):
+        pad = " " * (player_width - cell_len(position) - cell_len(name))
+        line: Line = [(" ", None), (position, "dim cyan"), (name + pad, "cyan")]
+
+        player_id = season_results.player_ids[player]
+        player_roster_weeks = roster_weeks.get(player_id, set()) if roster_weeks else None
+        for week, result_row in enumerate(cells[player], start=1):
+            if result_row >= 0:
+                tier = season_results.tier_at(result_row)
+                if show_points:
+                    pts = f"{season_results.points[result_row]:.0f}"
+                    line.extend(_cell(f"{pts:>4}", TIER_COLORS[tier], col_width))
+                else:
+                    line.extend(tier_cells[tier])
+            elif player_roster_weeks is None or week in player_roster_weeks:
+                line.extend(no_data)
+            else:
+                line.extend(off_roster)
+        line.append((" ", None))
+
+        lines.append(line)
+        lines.append(blank)
+
+    return PixelGrid(lines, width, title_fits=title_width <= width)
+
+
+def _center(text: str, width: int) -> str:
+    """Center text in a column the way Rich does (extra space on the right)."""
+    excess = width - cell_len(text)
+    left = excess // 2
+    return " " * left + text + " " * (excess - left)
+
+
+def _cell(text: str, style: str, width: int) -> Line:
+    """Pieces for a separator plus one centered, styled cell."""
+    excess = width - cell_len(text)
+    left = excess // 2
+    return [(" " + " " * left, None), (text, style), (" " * (excess - left), None)]
@@ -1,13 +1,21 @@
 """Terminal pixel grid visualization."""
 
+import json
+from array import array
+from collections.abc import Iterable, Iterator
+from html import escape
 from pathlib import Path
-
-from rich.box import SIMPLE_HEAD
-from rich.console import Console
-from rich.table import Table
-from rich.text import Text
+from typing import TYPE_CHECKING, TextIO
 
 from .rankings import PlayerWeekResult, Tier
+from .results import TIER_CODES, SeasonResults
+
+# Rich is imported by the terminal renderers that use it, so HTML-only
+# code paths never load it
+if TYPE_CHECKING:
+    from rich.console import Console
+    from rich.table import Table
+    from rich.text import Text
 
 # Position sort order
 POSITION_ORDER = {"QB": 0, "RB": 1, "WR": 2, "TE": 3, "K": 4, "DEF": 5}
@@ -29,6 +37,12 @@ TIER_HTML_COLORS = {
     None: "#f6f8fa",  # No data
 }
 
+# Terminal grid renderers: fast ANSI rows where possible, or always a Rich table
+GRID_RENDERERS = ("auto", "rich")
+
+# HTML output styles: per-cell inline CSS, CSS tier classes, or JSON drawn client-side
+HTML_STYLES = ("inline", "compact", "data")
+
 # Density blocks - visual distinction by fill density
 TIER_SYMBOLS = {
     Tier.ELITE: "█",  # Full block - Top 5
@@ -48,31 +62,33 @@ TIER_HTML_SIZES = {
 
 
 def _prepare_player_data(
-    results: list[PlayerWeekResult],
+    results: SeasonResults | list[PlayerWeekResult],
     position_filter: list[str] | None = None,
-) -> tuple[dict[str, dict[int, PlayerWeekResult]], list[tuple[str, tuple[str, str]]]]:
+) -> tuple[SeasonResults, list[tuple[int, tuple[str, str]]]]:
     """
-    Group results by player and prepare sorted player list.
+    Prepare sorted player list.
 
     Returns:
-        Tuple of (player_weeks dict, sorted_players list)
-        - player_weeks: {player_id: {week: PlayerWeekResult}}
-        - sorted_players: [(player_id, (name, position)), ...] sorted by position then name
+        Tuple of (season_results, sorted_players list)
+        - season_results: results as SeasonResults (converted if a list was given)
+        - sorted_players: [(player, (name, position)), ...] sorted by position then name,
+          where player indexes the SeasonResults player tables
     """
-    player_weeks: dict[str, dict[int, PlayerWeekResult]] = {}
-    player_info: dict[str, tuple[str, str]] = {}
+    if isinstance(results, SeasonResults):
+        season_results = results
+    else:
+        season_results = SeasonResults.from_results(results)
 
-    for result in results:
-        if result.player_id not in player_weeks:
-            player_weeks[result.player_id] = {}
-            player_info[result.player_id] = (result.player_name, result.position)
-        player_weeks[result.player_id][result.week] = result
+    player_info = {
+        player: (season_results.player_names[player], season_results.positions[player])
+        for player in range(len(season_results.player_ids))
+    }
 
     # Filter by position if specified
     if position_filter:
         player_info = {
-            pid: info
-            for pid, info in player_info.items()
+            player: info
+            for player, info in player_info.items()
             if info[1] in position_filter
         }
 
@@ -82,18 +98,19 @@ def _prepare_player_data(
         key=lambda x: (POSITION_ORDER.get(x[1][1], 99), x[1][0]),
     )
 
-    return player_weeks, sorted_players
+    return season_results, sorted_players
 
 
 def render_pixel_grid(
-    results: list[PlayerWeekResult],
+    results: SeasonResults | list[PlayerWeekResult],
     team_name: str,
     season: str,
     max_week: int,
-    console: Console | None = None,
+    console: "Console | None" = None,
     show_points: bool = False,
     position_filter: list[str] | None = None,
     roster_weeks: dict[str, set[int]] | None = None,
+    renderer: str = "auto",
 ) -> None:
     """
     Render a GitHub-style pixel grid showing roster performance.
@@ -105,16 +122,77 @@ def render_pixel_grid(
     Args:
         roster_weeks: Optional dict mapping player_id to set of weeks they were on roster.
                       Used to distinguish "not on roster" (blank) from "on roster, no data" (·)
+        renderer: "auto" writes precomputed ANSI rows when the console is a color
+                  terminal wide enough for the grid, else uses a Rich table; "rich"
+                  always uses the Rich table
     """
     if console is None:
+        from rich.console import Console
+
         console = Console()
 
-    player_weeks, sorted_players = _prepare_player_data(results, position_filter)
+    if renderer == "auto":
+        from .fastgrid import build_pixel_grid
+
+        grid = build_pixel_grid(
+            results,
+            team_name,
+            season,
+            max_week,
+            show_points=show_points,
+            position_filter=position_filter,
+            roster_weeks=roster_weeks,
+        )
+        if grid is None:
+            console.print("[yellow]No performance data found for this roster.[/yellow]")
+            return
+        if grid.can_write(console):
+            console.print()
+            grid.write(console)
+            console.print()
+            render_legend(console)
+            return
+
+    table = build_pixel_table(
+        results,
+        team_name,
+        season,
+        max_week,
+        show_points=show_points,
+        position_filter=position_filter,
+        roster_weeks=roster_weeks,
+    )
 
-    if not sorted_players:
+    if table is None:
         console.print("[yellow]No performance data found for this roster.[/yellow]")
         return
 
+    console.print()
+    console.print(table)
+    console.print()
+
+    # Print legend
+    render_legend(console)
+
+
+def build_pixel_table(
+    results: SeasonResults | list[PlayerWeekResult],
+    team_name: str,
+    season: str,
+    max_week: int,
+    show_points: bool = False,
+    position_filter: list[str] | None = None,
+    roster_weeks: dict[str, set[int]] | None = None,
+) -> "Table | None":
+    """Build the pixel grid table, or None if there is nothing to show."""
+    from rich.box import SIMPLE_HEAD
+    from rich.table import Table
+
+    season_results, sorted_players = _prepare_player_data(results, position_filter)
+
+    if not sorted_players:
+        return None
+
     # Build the table with horizontal lines between rows
     table = Table(
         title=f"{team_name} - {season} Season Performance",
@@ -134,19 +212,22 @@ def render_pixel_grid(
         table.add_column(str(week), justify="center", width=col_width)
 
     # Add rows for each player
-    for player_id, (name, position) in sorted_players:
+    cells = season_results.matrix(max_week)
+    for player, (name, position) in sorted_players:
         # Build the row
         row = [f"[dim]{position}[/dim] {name[:15]}"]
 
-        weeks_data = player_weeks.get(player_id, {})
+        player_id = season_results.player_ids[player]
+        player_cells = cells[player]
         player_roster_weeks = roster_weeks.get(player_id, set()) if roster_weeks else None
         for week in range(1, max_week + 1):
-            if week in weeks_data:
-                result = weeks_data[week]
-                color = TIER_COLORS[result.tier]
-                symbol = TIER_SYMBOLS[result.tier]
+            result_row = player_cells[week - 1]
+            if result_row >= 0:
+                tier = season_results.tier_at(result_row)
+                color = TIER_COLORS[tier]
+                symbol = TIER_SYMBOLS[tier]
                 if show_points:
-                    pts = f"{result.points:.0f}"
+                    pts = f"{season_results.points[result_row]:.0f}"
                     row.append(f"[{color}]{pts:>4}[/{color}]")
                 else:
                     row.append(f"[{color}]{symbol}[/{color}]")
@@ -159,16 +240,19 @@ def render_pixel_grid(
 
         table.add_row(*row)
 
-    console.print()
-    console.print(table)
+    return table
+
+
+def render_legend(console: "Console") -> None:
+    """Render the color legend."""
+    console.print(build_legend())
     console.print()
 
-    # Print legend
-    render_legend(console)
 
+def build_legend() -> "Text":
+    """Build the color legend."""
+    from rich.text import Text
 
-def render_legend(console: Console) -> None:
-    """Render the color legend."""
     legend = Text("Legend: ")
     legend.append(TIER_SYMBOLS[Tier.ELITE], style=TIER_COLORS[Tier.ELITE])
     legend.append(" Top 5  ")
@@ -180,31 +264,358 @@ def render_legend(console: Console) -> None:
     legend.append(" Below  ")
     legend.append("·", style="dim")
     legend.append(" No data")
-
-    console.print(legend)
-    console.print()
+    return legend
 
 
 def export_html(
-    results: list[PlayerWeekResult],
+    results: SeasonResults | list[PlayerWeekResult],
     team_name: str,
     season: str,
     max_week: int,
     output_path: Path,
     position_filter: list[str] | None = None,
     roster_weeks: dict[str, set[int]] | None = None,
+    style: str = "inline",
 ) -> None:
     """Export the pixel grid as an HTML file with proper CSS colors."""
-    player_weeks, sorted_players = _prepare_player_data(results, position_filter)
+    with output_path.open("w", encoding="utf-8") as output:
+        write_html(
+            output,
+            results,
+            team_name,
+            season,
+            max_week,
+            position_filter,
+            roster_weeks,
+            style=style,
+        )
+
+
+def render_html(
+    results: SeasonResults | list[PlayerWeekResult],
+    team_name: str,
+    season: str,
+    max_week: int,
+    position_filter: list[str] | None = None,
+    roster_weeks: dict[str, set[int]] | None = None,
+    style: str = "inline",
+) -> str:
+    """Render the pixel grid as an HTML document with proper CSS colors."""
+    return "".join(
+        iter_html(
+            results, team_name, season, max_week, position_filter, roster_weeks, style=style
+        )
+    )
+
+
+def write_html(
+    output: TextIO,
+    results: SeasonResults | list[PlayerWeekResult],
+    team_name: str,
+    season: str,
+    max_week: int,
+    position_filter: list[str] | None = None,
+    roster_weeks: dict[str, set[int]] | None = None,
+    style: str = "inline",
+) -> None:
+    """Stream the pixel grid as HTML to a text file-like object (file, stdout, gzip...)."""
+    for chunk in iter_html(
+        results, team_name, season, max_week, position_filter, roster_weeks, style=style
+    ):
+        output.write(chunk)
+
+
+def iter_html(
+    results: SeasonResults | list[PlayerWeekResult],
+    team_name: str,
+    season: str,
+    max_week: int,
+    position_filter: list[str] | None = None,
+    roster_weeks: dict[str, set[int]] | None = None,
+    style: str = "inline",
+) -> Iterator[str]:
+    """
+    Generate the pixel grid HTML document a row at a time.
+
+    Args:
+        style: One of HTML_STYLES - "inline" styles every cell, "compact"
+               uses one CSS class per tier, and "data" embeds the grid as
+               JSON drawn by a small script in the browser
+    """
+    title = f"{team_name} - {season} Season Performance"
+    yield _html_head(title, style)
+    yield from _iter_html_grid(results, title, max_week, position_filter, roster_weeks, style)
+    yield _html_legend()
+    yield _html_tail(style)
+
+
+def iter_combined_html(
+    title: str,
+    grids: Iterable[tuple[SeasonResults | list[PlayerWeekResult], str, dict[str, set[int]] | None]],
+    season: str,
+    max_week: int,
+    position_filter: list[str] | None = None,
+    style: str = "inline",
+) -> Iterator[str]:
+    """
+    Generate one HTML document holding several pixel grids.
+
+    Args:
+        grids: (results, team_name, roster_weeks) for each grid. Consumed lazily,
+               so a generator keeps only one team's results in memory at a time.
+        style: One of HTML_STYLES, as for iter_html()
+    """
+    yield _html_head(title, style)
+    for results, team_name, roster_weeks in grids:
+        grid_title = f"{team_name} - {season} Season Performance"
+        yield from _iter_html_grid(
+            results, grid_title, max_week, position_filter, roster_weeks, style
+        )
+    yield _html_legend()
+    yield _html_tail(style)
+
+
+def iter_seasons_html(
+    title: str,
+    grids: Iterable[
+        tuple[SeasonResults | list[PlayerWeekResult], str, str, int, dict[str, set[int]] | None]
+    ],
+    position_filter: list[str] | None = None,
+    style: str = "inline",
+) -> Iterator[str]:
+    """
+    Generate one HTML document holding a grid per season.
+
+    Args:
+        grids: (results, team_name, season, max_week, roster_weeks) for each grid
+        style: One of HTML_STYLES, as for iter_html()
+    """
+    yield _html_head(title, style)
+    for results, team_name, season, max_week, roster_weeks in grids:
+        grid_title = f"{team_name} - {season} Season Performance"
+        yield from _iter_html_grid(
+            results, grid_title, max_week, position_filter, roster_weeks, style
+        )
+    yield _html_legend()
+    yield _html_tail(style)
+
+
+def _iter_html_grid(
+    results: SeasonResults | list[PlayerWeekResult],
+    title: str,
+    max_week: int,
+    position_filter: list[str] | None = None,
+    roster_weeks: dict[str, set[int]] | None = None,
+    style: str = "inline",
+) -> Iterator[str]:
+    """Generate the heading and table for one grid."""
+    if style not in HTML_STYLES:
+        raise ValueError(f"Unknown HTML style: {style}")
+
+    season_results, sorted_players = _prepare_player_data(results, position_filter)
+    cells = season_results.matrix(max_week)
+    if style == "data":
+        yield from _iter_data_grid(
+            season_results, sorted_players, cells, title, max_week, roster_weeks
+        )
+        return
+
+    yield _HTML_GRID_OPEN.format(title=escape(title))
+
+    # Week headers
+    yield "".join(
+        f'                    <th>{week}</th>\n' for week in range(1, max_week + 1)
+    )
+    yield "                </tr>\n            </thead>\n            <tbody>\n"
 
-    # Build HTML
-    html_parts = [
-        """<!DOCTYPE html>
+    # Player rows
+    render_row = _compact_row if style == "compact" else _inline_row
+    indent = "" if style == "compact" else "                "
+    current_position = None
+    for player, (name, position) in sorted_players:
+        spacer = ""
+
+        # Add spacer row between positions
+        if current_position is not None and position != current_position:
+            spacer = f'{indent}<tr class="spacer-row"><td colspan="{max_week + 1}"></td></tr>\n'
+        current_position = position
+
+        player_id = season_results.player_ids[player]
+        player_roster_weeks = roster_weeks.get(player_id, set()) if roster_weeks else None
+        # Names come from other league members and the player database
+        yield spacer + render_row(
+            season_results,
+            cells[player],
+            escape(name),
+            escape(position),
+            max_week,
+            player_roster_weeks,
+        )
+
+    yield _HTML_GRID_CLOSE
+
+
+def _inline_row(
+    season_results: SeasonResults,
+    player_cells: array,
+    name: str,
+    position: str,
+    max_week: int,
+    player_roster_weeks: set[int] | None,
+) -> str:
+    """Build a player's table row with every cell styled inline."""
+    row_parts = ["                <tr>\n"]
+    row_parts.append(
+        f'                    <td class="player-name"><span class="position">{position}</span>{name}</td>\n'
+    )
+
+    for week in range(1, max_week + 1):
+        result_row = player_cells[week - 1]
+        if result_row >= 0:
+            tier = season_results.tier_at(result_row)
+            color = TIER_HTML_COLORS[tier]
+            size = TIER_HTML_SIZES[tier]
+            points = season_results.points[result_row]
+            rank = season_results.rank[result_row]
+            tooltip = f"Week {week}: {points:.1f} pts (#{rank} {position})"
+            row_parts.append(
+                f'                    <td><div class="cell tooltip" style="background-color: {color}; width: {size}px; height: {size}px;" data-tooltip="{tooltip}"></div></td>\n'
+            )
+        elif player_roster_weeks is None or week in player_roster_weeks:
+            # On roster but no scoring data
+            color = TIER_HTML_COLORS[None]
+            size = TIER_HTML_SIZES[None]
+            row_parts.append(
+                f'                    <td><div class="cell" style="background-color: {color}; width: {size}px; height: {size}px;"></div></td>\n'
+            )
+        else:
+            # Not on roster - empty cell
+            row_parts.append(
+                '                    <td></td>\n'
+            )
+
+    row_parts.append("                </tr>\n")
+    return "".join(row_parts)
+
+
+def _compact_row(
+    season_results: SeasonResults,
+    player_cells: array,
+    name: str,
+    position: str,
+    max_week: int,
+    player_roster_weeks: set[int] | None,
+) -> str:
+    """Build a player's table row on one line, styling cells by tier class."""
+    row_parts = [f'<tr><td class="player-name"><span class="position">{position}</span>{name}</td>']
+    for week in range(1, max_week + 1):
+        result_row = player_cells[week - 1]
+        if result_row >= 0:
+            points = season_results.points[result_row]
+            rank = season_results.rank[result_row]
+            row_parts.append(
+                f'<td><i class="t{season_results.tier[result_row]}" '
+                f'data-tooltip="Week {week}: {points:.1f} pts (#{rank} {position})"></i></td>'
+            )
+        elif player_roster_weeks is None or week in player_roster_weeks:
+            row_parts.append('<td><i class="tn"></i></td>')
+        else:
+            row_parts.append("<td></td>")
+    row_parts.append("</tr>\n")
+    return "".join(row_parts)
+
+
+def _iter_data_grid(
+    season_results: SeasonResults,
+    sorted_players: list[tuple[int, tuple[str, str]]],
+    cells: list[array],
+    title: str,
+    max_week: int,
+    roster_weeks: dict[str, set[int]] | None,
+) -> Iterator[str]:
+    """
+    Generate one grid as embedded JSON, a player per line.
+
+    Each player is [name, position, codes, points, ranks]: codes has one
+    character per week (a tier code, "n" for no data or "." when not on
+    the roster) and points/ranks list the scored weeks in order.
+    """
+    yield (
+        f'    <h1>{escape(title)}</h1>\n'
+        f'    <div class="grid-container">'
+        f'<script type="application/json" class="grid-data">'
+        f'{{"weeks":{max_week},"players":[\n'
+    )
+    separator = ""
+    for player, (name, position) in sorted_players:
+        player_id = season_results.player_ids[player]
+        player_roster_weeks = roster_weeks.get(player_id, set()) if roster_weeks else None
+        codes = []
+        points = []
+        ranks = []
+        for week, result_row in enumerate(cells[player], start=1):
+            if result_row >= 0:
+                codes.append(str(season_results.tier[result_row]))
+                points.append(round(season_results.points[result_row], 1))
+                ranks.append(season_results.rank[result_row])
+            elif player_roster_weeks is None or week in player_roster_weeks:
+                codes.append("n")
+            else:
+                codes.append(".")
+        entry = json.dumps([name, position, "".join(codes), points, ranks], separators=(",", ":"))
+        # Keep "</script>" and friends in names from ending the block
+        yield separator + entry.replace("<", "\\u003c")
+        separator = ",\n"
+    yield "\n]}</script></div>\n"
+
+
+def _html_legend() -> str:
+    """Build the HTML legend."""
+    return _HTML_LEGEND.format(
+        elite=TIER_HTML_COLORS[Tier.ELITE],
+        great=TIER_HTML_COLORS[Tier.GREAT],
+        good=TIER_HTML_COLORS[Tier.GOOD],
+        avg=TIER_HTML_COLORS[Tier.AVERAGE],
+        none=TIER_HTML_COLORS[None],
+    )
+
+
+def _html_head(title: str, style: str) -> str:
+    """Build the document head for an HTML style."""
+    extra_css = "" if style == "inline" else _tier_css()
+    return _HTML_HEAD.format(title=escape(title), extra_css=extra_css)
+
+
+def _tier_css() -> str:
+    """Build the tier class rules used by the compact and data styles."""
+    rules = [_HTML_TIER_CELL_CSS]
+    for tier, code in TIER_CODES.items():
+        rules.append(_tier_rule(f"t{code}", tier))
+    rules.append(_tier_rule("tn", None))
+    return "".join(rules)
+
+
+def _tier_rule(name: str, tier: Tier | None) -> str:
+    """Build the CSS rule for one tier class."""
+    color = TIER_HTML_COLORS[tier]
+    size = TIER_HTML_SIZES[tier]
+    return f"        .{name} {{ background-color: {color}; width: {size}px; height: {size}px; }}\n"
+
+
+def _html_tail(style: str) -> str:
+    """Build the end of the document for an HTML style."""
+    if style == "data":
+        return _HTML_DATA_SCRIPT + _HTML_TAIL
+    return _HTML_TAIL
+
+
+# Document head, up to and including the opening <body>
+_HTML_HEAD = """<!DOCTYPE html>
 <html lang="en">
 <head>
     <meta charset="UTF-8">
     <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>{team_name} - {season} Season Performance</title>
+    <title>{title}</title>
     <style>
         body {{
             font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Helvetica, Arial, sans-serif;
@@ -294,87 +705,101 @@ def export_html(
             z-index: 100;
             border: 1px solid #30363d;
         }}
-    </style>
+{extra_css}    </style>
 </head>
 <body>
-    <h1>{team_name} - {season} Season Performance</h1>
+"""
+
+# Cell box shared by the tier classes of the compact and data styles
+_HTML_TIER_CELL_CSS = """        td > i {
+            border-radius: 2px;
+            margin: 1px;
+            display: inline-block;
+            cursor: pointer;
+            vertical-align: middle;
+            position: relative;
+        }
+        td > i:hover {
+            outline: 1px solid #58a6ff;
+        }
+        td > i[data-tooltip]:hover::after {
+            content: attr(data-tooltip);
+            position: absolute;
+            bottom: 100%;
+            left: 50%;
+            transform: translateX(-50%);
+            background: #1f2428;
+            color: #c9d1d9;
+            padding: 4px 8px;
+            border-radius: 4px;
+            font-size: 11px;
+            white-space: nowrap;
+            z-index: 100;
+            border: 1px solid #30363d;
+        }
+"""
+
+# Heading and table header for one grid (week headers follow)
+_HTML_GRID_OPEN = """    <h1>{title}</h1>
     <div class="grid-container">
         <table>
             <thead>
                 <tr>
                     <th class="player-name">Player</th>
-""".format(
-            team_name=team_name, season=season
-        )
-    ]
+"""
 
-    # Week headers
-    for week in range(1, max_week + 1):
-        html_parts.append(f'                    <th>{week}</th>\n')
-    html_parts.append("                </tr>\n            </thead>\n            <tbody>\n")
-
-    # Player rows
-    current_position = None
-    for player_id, (name, position) in sorted_players:
-        # Add spacer row between positions
-        if current_position is not None and position != current_position:
-            html_parts.append(
-                f'                <tr class="spacer-row"><td colspan="{max_week + 1}"></td></tr>\n'
-            )
-        current_position = position
-
-        html_parts.append("                <tr>\n")
-        html_parts.append(
-            f'                    <td class="player-name"><span class="position">{position}</span>{name}</td>\n'
-        )
-
-        weeks_data = player_weeks.get(player_id, {})
-        player_roster_weeks = roster_weeks.get(player_id, set()) if roster_weeks else None
-        for week in range(1, max_week + 1):
-            if week in weeks_data:
-                result = weeks_data[week]
-                color = TIER_HTML_COLORS[result.tier]
-                size = TIER_HTML_SIZES[result.tier]
-                tooltip = f"Week {week}: {result.points:.1f} pts (#{result.rank} {position})"
-                html_parts.append(
-                    f'                    <td><div class="cell tooltip" style="background-color: {color}; width: {size}px; height: {size}px;" data-tooltip="{tooltip}"></div></td>\n'
-                )
-            elif player_roster_weeks is None or week in player_roster_weeks:
-                # On roster but no scoring data
-                color = TIER_HTML_COLORS[None]
-                size = TIER_HTML_SIZES[None]
-                html_parts.append(
-                    f'                    <td><div class="cell" style="background-color: {color}; width: {size}px; height: {size}px;"></div></td>\n'
-                )
-            else:
-                # Not on roster - empty cell
-                html_parts.append(
-                    '                    <td></td>\n'
-                )
-
-        html_parts.append("                </tr>\n")
-
-    # Close table and add legend
-    html_parts.append(
-        """            </tbody>
+_HTML_GRID_CLOSE = """            </tbody>
         </table>
     </div>
-    <div class="legend">
+"""
+
+_HTML_LEGEND = """    <div class="legend">
         <span class="legend-item"><span class="legend-box" style="background-color: {elite};"></span>Top 5</span>
         <span class="legend-item"><span class="legend-box" style="background-color: {great};"></span>Top 10</span>
         <span class="legend-item"><span class="legend-box" style="background-color: {good};"></span>Top 15</span>
         <span class="legend-item"><span class="legend-box" style="background-color: {avg};"></span>Below</span>
         <span class="legend-item"><span class="legend-box" style="background-color: {none};"></span>No data</span>
     </div>
-</body>
-</html>
-""".format(
-            elite=TIER_HTML_COLORS[Tier.ELITE],
-            great=TIER_HTML_COLORS[Tier.GREAT],
-            good=TIER_HTML_COLORS[Tier.GOOD],
-            avg=TIER_HTML_COLORS[Tier.AVERAGE],
-            none=TIER_HTML_COLORS[None],
-        )
-    )
+"""
+
+# Draws each grid-data block of the data style as a table
+_HTML_DATA_SCRIPT = """    <script>
+        const escapeHtml = (s) => s.replace(/[&<>"']/g, (c) => "&#" + c.charCodeAt(0) + ";");
+        for (const block of document.querySelectorAll("script.grid-data")) {
+            const grid = JSON.parse(block.textContent);
+            const html = ['<thead><tr><th class="player-name">Player</th>'];
+            for (let week = 1; week <= grid.weeks; week++) html.push("<th>" + week + "</th>");
+            html.push("</tr></thead><tbody>");
+            let lastPosition = null;
+            for (const [name, position, codes, points, ranks] of grid.players) {
+                if (lastPosition !== null && position !== lastPosition) {
+                    html.push('<tr class="spacer-row"><td colspan="' + (grid.weeks + 1) + '"></td></tr>');
+                }
+                lastPosition = position;
+                html.push('<tr><td class="player-name"><span class="position">' + escapeHtml(position) + "</span>" + escapeHtml(name) + "</td>");
+                let scored = 0;
+                for (let week = 1; week <= grid.weeks; week++) {
+                    const code = codes[week - 1];
+                    if (code === ".") {
+                        html.push("<td></td>");
+                    } else if (code === "n") {
+                        html.push('<td><i class="tn"></i></td>');
+                    } else {
+                        const tooltip = "Week " + week + ": " + points[scored].toFixed(1) + " pts (#" + ranks[scored] + " " + position + ")";
+                        html.push('<td><i class="t' + code + '" data-tooltip="' + escapeHtml(tooltip) + '"></i></td>');
+                        scored++;
+                    }
+                }
+                html.push("</tr>");
+            }
+            html.push("</tbody>");
+            const table = document.createElement("table");
+            table.innerHTML = html.join("");
+            block.replaceWith(table);
+        }
+    </script>
+"""
 
-    output_path.write_text("".join(html_parts))
+_HTML_TAIL = """</body>
+</html>
+"""
@@ -0,0 +1,275 @@
+"""Multi-season history: follow a league back through its previous seasons."""
+
+import pickle
+import zlib
+from collections.abc import Iterable
+from dataclasses import dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING
+
+from .api import SleeperAPI
+from .cache import write_bytes
+from .league import LeagueData, TeamReport, iter_team_reports, load_league
+from .results import SeasonResults, pack_weeks, unpack_weeks
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Bump when the archive layout or its rankings change so stale files are rebuilt
+ARCHIVE_FORMAT_VERSION = 2
+
+
+@dataclass
+class SeasonHistory:
+    """One season of a league, with every team's results."""
+
+    league_id: str
+    season: str
+    name: str
+    previous_league_id: str | None
+    max_week: int
+    teams: list[TeamReport]
+
+    @classmethod
+    def from_league(cls, league: LeagueData, previous_league_id: str | None) -> "SeasonHistory":
+        """Build every team's results for a loaded league."""
+        return cls(
+            league_id=league.league_id,
+            season=league.season,
+            name=league.name,
+            previous_league_id=previous_league_id,
+            max_week=league.max_week,
+            teams=list(iter_team_reports(league)),
+        )
+
+    def team_for(self, owner_id: str) -> TeamReport | None:
+        """Get the team a user owned this season, or None if they didn't play."""
+        for team in self.teams:
+            if team.owner_id == owner_id:
+                return team
+        return None
+
+    def to_bytes(self) -> bytes:
+        """
+        Serialize to a compact binary form.
+
+        Results use SeasonResults.to_bytes() and each player's roster weeks
+        are packed into one integer bitmask, then the whole payload is
+        compressed.
+        """
+        teams = [
+            (
+                team.roster_id,
+                team.owner_id,
+                team.team_name,
+                team.results.to_bytes(),
+                {
+                    player_id: pack_weeks(weeks)
+                    for player_id, weeks in team.roster_weeks.items()
+                },
+            )
+            for team in self.teams
+        ]
+        payload = (
+            ARCHIVE_FORMAT_VERSION,
+            self.league_id,
+            self.season,
+            self.name,
+            self.previous_league_id,
+            self.max_week,
+            teams,
+        )
+        return zlib.compress(pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeasonHistory":
+        """Load a season written by to_bytes()."""
+        version, *fields = pickle.loads(zlib.decompress(data))
+        if version != ARCHIVE_FORMAT_VERSION:
+            raise ValueError(f"Unsupported archive format version: {version}")
+        league_id, season, name, previous_league_id, max_week, teams = fields
+        return cls(
+            league_id=league_id,
+            season=season,
+            name=name,
+            previous_league_id=previous_league_id,
+            max_week=max_week,
+            teams=[
+                TeamReport(
+                    roster_id=roster_id,
+                    owner_id=owner_id,
+                    team_name=team_name,
+                    results=SeasonResults.from_bytes(results),
+                    roster_weeks={
+                        player_id: unpack_weeks(mask) for player_id, mask in weeks.items()
+                    },
+                )
+                for roster_id, owner_id, team_name, results, weeks in teams
+            ],
+        )
+
+
+class SeasonArchive:
+    """
+    Finalized seasons stored on disk, one file per league.
+
+    A completed season can never change, so once archived it is read back
+    without any requests, player database or ranking work.
+    """
+
+    def __init__(self, root: Path):
+        self.root = root
+
+    @classmethod
+    def under(cls, cache_dir: Path) -> "SeasonArchive":
+        """The archive kept under a cache directory."""
+        return cls(cache_dir / "history")
+
+    def path(self, league_id: str) -> Path:
+        """Location of a league's archived season."""
+        return self.root / f"{league_id}.bin"
+
+    def load(self, league_id: str) -> SeasonHistory | None:
+        """Load an archived season, or None if missing, stale or corrupt."""
+        try:
+            history = SeasonHistory.from_bytes(self.path(league_id).read_bytes())
+        except (OSError, zlib.error, pickle.UnpicklingError, ValueError, TypeError, EOFError):
+            return None
+        return history if history.league_id == league_id else None
+
+    def save(self, history: SeasonHistory) -> None:
+        """Archive a finalized season."""
+        write_bytes(self.path(history.league_id), history.to_bytes())
+
+
+def parse_seasons(spec: str) -> list[str]:
+    """
+    Parse a season range like "2021-2025" (or a single "2024"), oldest first.
+
+    Raises:
+        ValueError: If the range is malformed or backwards
+    """
+    first, _, last = spec.partition("-")
+    last = last or first
+    if not (first.isdigit() and last.isdigit()):
+        raise ValueError(f"Invalid season range '{spec}' (expected e.g. 2021-2025)")
+    if int(first) > int(last):
+        raise ValueError(f"Season range '{spec}' is backwards")
+    return [str(year) for year in range(int(first), int(last) + 1)]
+
+
+def load_history(
+    api: SleeperAPI,
+    league_id: str,
+    seasons: Iterable[str],
+    archive: SeasonArchive | None = None,
+    refresh_players: bool = False,
+    console: "Console | None" = None,
+    state: dict | None = None,
+    engine: str = "python",
+) -> list[SeasonHistory]:
+    """
+    Load a league's seasons by following its previous_league_id chain.
+
+    Seasons in the archive are read from it, including the link to the
+    season before, so a fully archived range needs no requests. Others go
+    through load_league(), and are archived once the league is complete.
+    With refresh_players the player database is downloaded again (once)
+    and every season is loaded again and re-archived, so a corrected
+    player database reaches archived seasons too.
+
+    Args:
+        league_id: League to start from (the newest season wanted, or later)
+        seasons: Seasons to include
+        archive: Where finalized seasons are stored (None disables archiving)
+
+    Returns:
+        The seasons found, oldest first
+    """
+    wanted = set(seasons)
+    oldest = min(int(season) for season in wanted)
+    histories: list[SeasonHistory] = []
+    current: str | None = league_id
+    # The player database is downloaded again once, for the first season loaded
+    refresh_index = refresh_players
+
+    while current:
+        history = (
+            archive.load(current) if archive is not None and not refresh_players else None
+        )
+        if history is not None:
+            season, previous = history.season, history.previous_league_id
+        else:
+            info = api.get_league(current)
+            if not info:
+                break
+            season = str(info.get("season", ""))
+            previous = info.get("previous_league_id")
+
+        if not season.isdigit() or int(season) < oldest:
+            break
+        if history is None and season in wanted:
+            if console is not None:
+                console.print(f"[dim]Loading {season} season...[/dim]")
+            league = load_league(
+                api,
+                current,
+                refresh_players=refresh_index,
+                state=state,
+                engine=engine,
+            )
+            refresh_index = False
+            history = SeasonHistory.from_league(league, previous)
+            if archive is not None and league.complete:
+                archive.save(history)
+        if history is not None and season in wanted:
+            histories.append(history)
+
+        # Sleeper uses "0" as well as null for "no previous league"
+        current = previous if previous and previous != "0" else None
+
+    histories.reverse()
+    return histories
+
+
+def merge_seasons(
+    teams: Iterable[tuple[TeamReport, int]],
+) -> tuple[SeasonResults, dict[str, set[int]], int]:
+    """
+    Join several seasons of one team into a single long grid.
+
+    Weeks are numbered on from one season to the next, so the second
+    season's week 1 follows the first season's last week.
+
+    Args:
+        teams: (team, max_week) for each season, oldest first
+
+    Returns:
+        Tuple of (results, roster_weeks, total_weeks)
+    """
+    merged = SeasonResults()
+    roster_weeks: dict[str, set[int]] = {}
+    offset = 0
+    for team, max_week in teams:
+        results = team.results
+        for row in range(len(results)):
+            week = results.week[row]
+            if week > max_week:
+                continue
+            player = results.player[row]
+            merged.add(
+                results.player_ids[player],
+                results.player_names[player],
+                results.positions[player],
+                offset + week,
+                results.points[row],
+                results.rank[row],
+                results.tier_at(row),
+            )
+        for player_id, weeks in team.roster_weeks.items():
+            roster_weeks.setdefault(player_id, set()).update(
+                offset + week for week in weeks if week <= max_week
+            )
+        offset += max_week
+    return merged, roster_weeks, offset
+
@@ -0,0 +1,93 @@
+"""Roster membership index for a league's season."""
+
+
+class RosterIndex:
+    """
+    Which players were on which roster in which week.
+
+    Built in a single pass over a season's matchups, after which looking up
+    a roster's players or a player's roster history is a dict access.
+    """
+
+    def __init__(self):
+        # roster_id -> player_id -> weeks on that roster
+        self._rosters: dict[int, dict[str, set[int]]] = {}
+        # player_id -> week -> roster_id
+        self._players: dict[str, dict[int, int]] = {}
+
+    @classmethod
+    def from_matchups(cls, weekly_matchups: dict[int, list[dict]]) -> "RosterIndex":
+        """Build an index from matchups keyed by week."""
+        index = cls()
+        for week, matchups in weekly_matchups.items():
+            for matchup in matchups:
+                roster_id = matchup.get("roster_id")
+                if roster_id is not None:
+                    index.add(week, roster_id, matchup.get("players") or [])
+        return index
+
+    @classmethod
+    def from_week_rosters(
+        cls, week_rosters: dict[int, dict[int, list[str]]]
+    ) -> "RosterIndex":
+        """Build an index from {week: {roster_id: player_ids}}."""
+        index = cls()
+        for week, rosters in week_rosters.items():
+            for roster_id, player_ids in rosters.items():
+                index.add(week, roster_id, player_ids)
+        return index
+
+    def add(self, week: int, roster_id: int, player_ids: list[str]) -> None:
+        """Record a roster's players for a week."""
+        roster = self._rosters.setdefault(roster_id, {})
+        for player_id in player_ids:
+            roster.setdefault(player_id, set()).add(week)
+            self._players.setdefault(player_id, {})[week] = roster_id
+
+    def replace_week(self, week: int, rosters: dict[int, list[str]]) -> None:
+        """Replace all roster membership for a week with {roster_id: player_ids}."""
+        for roster in self._rosters.values():
+            for player_id in [p for p, weeks in roster.items() if week in weeks]:
+                weeks = roster[player_id]
+                weeks.discard(week)
+                if not weeks:
+                    del roster[player_id]
+
+        for player_id in [p for p, weeks in self._players.items() if week in weeks]:
+            del self._players[player_id][week]
+            if not self._players[player_id]:
+                del self._players[player_id]
+
+        for roster_id, player_ids in rosters.items():
+            self.add(week, roster_id, player_ids)
+
+    def roster_ids(self) -> list[int]:
+        """Get all roster IDs seen in the season."""
+        return sorted(self._rosters)
+
+    def roster_weeks(self, roster_id: int) -> dict[str, set[int]]:
+        """Get which weeks each player was on a roster. Do not mutate the result."""
+        return self._rosters.get(roster_id, {})
+
+    def roster_players(self, roster_id: int) -> list[str]:
+        """Get all players who appeared on a roster throughout the season."""
+        return list(self._rosters.get(roster_id, {}))
+
+    def player_rosters(self, player_id: str) -> dict[int, int]:
+        """Get a player's roster_id for each week they were rostered."""
+        return self._players.get(player_id, {})
+
+    def player_moves(self, player_id: str) -> list[tuple[int, int | None, int]]:
+        """
+        Get the weeks a player joined a roster (draft, trade or waiver pickup).
+
+        Returns:
+            List of (week, previous roster_id or None, new roster_id)
+        """
+        moves = []
+        previous = None
+        for week, roster_id in sorted(self.player_rosters(player_id).items()):
+            if roster_id != previous:
+                moves.append((week, previous, roster_id))
+                previous = roster_id
+        return moves
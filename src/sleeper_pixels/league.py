@@ -0,0 +1,328 @@
+"""Load a league once and build per-team results from it."""
+
+import re
+import threading
+import time
+from collections.abc import Container, Iterable, Iterator
+from concurrent.futures import Future
+from dataclasses import dataclass
+from typing import TYPE_CHECKING
+
+from .api import SleeperAPI
+from .index import RosterIndex
+from .players import PlayerIndex
+from .profiling import stage
+from .rankings import LeagueRankings
+from .results import SeasonResults
+from .season import SeasonState, week_rosters
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Weeks fetched when looking for scoring data
+SEASON_WEEKS = range(1, 18)
+
+
+@dataclass
+class LeagueData:
+    """Everything fetched for a league, shared by all of its teams."""
+
+    league_id: str
+    name: str
+    season: str
+    rosters: list[dict]
+    team_names: dict[str, str]
+    weekly_matchups: dict[int, list[dict]]
+    max_week: int
+    players: PlayerIndex
+    rankings: LeagueRankings
+    roster_index: RosterIndex
+    season_state: SeasonState
+    complete: bool = False  # League is over; nothing in it can change
+
+
+@dataclass
+class TeamReport:
+    """Performance results for a single roster."""
+
+    roster_id: int
+    owner_id: str | None
+    team_name: str
+    results: SeasonResults
+    roster_weeks: dict[str, set[int]]
+
+    @property
+    def slug(self) -> str:
+        """Filesystem-safe name for this team's output files."""
+        name = re.sub(r"[^A-Za-z0-9]+", "-", self.team_name).strip("-").lower()
+        return f"{self.roster_id:02d}-{name}" if name else f"{self.roster_id:02d}"
+
+
+@dataclass
+class SeasonStatus:
+    """Which parts of a league's season can still change."""
+
+    weeks: list[int]  # Weeks that can have scoring data
+    final_weeks: set[int]  # Weeks whose matchups can no longer change
+    complete: bool  # League is over, so rosters and users are final too
+
+
+def season_status(state: dict, league: dict) -> SeasonStatus:
+    """
+    Work out which weeks of a league are finalized from the get_state response.
+
+    Past seasons and completed leagues are entirely final. In the current
+    season, weeks after the current one are skipped, and the previous week
+    stays live alongside the current one because stat corrections land a
+    few days after games are played.
+    """
+    weeks = list(SEASON_WEEKS)
+    season = str(league.get("season", ""))
+    current_season = str(state.get("season", ""))
+
+    past_season = (
+        season.isdigit() and current_season.isdigit() and int(season) < int(current_season)
+    )
+    if league.get("status") == "complete" or past_season:
+        return SeasonStatus(weeks, set(weeks), complete=True)
+    if season != current_season:
+        return SeasonStatus(weeks, set(), complete=False)
+
+    current_week = int(state.get("week") or 0)
+    if state.get("season_type") == "pre":
+        current_week = 1
+    if current_week < 1:
+        return SeasonStatus(weeks, set(), complete=False)
+
+    return SeasonStatus(
+        weeks=[w for w in weeks if w <= current_week],
+        final_weeks={w for w in weeks if w < current_week - 1},
+        complete=False,
+    )
+
+
+def has_scoring_data(matchups: list[dict] | None) -> bool:
+    """Check if a week's matchups have actual scoring data."""
+    return any(m.get("players_points") for m in matchups) if matchups else False
+
+
+def fetch_weekly_matchups(
+    api: SleeperAPI,
+    league_id: str,
+    weeks: Iterable[int] = SEASON_WEEKS,
+    final_weeks: Container[int] = (),
+) -> dict[int, list[dict]]:
+    """Fetch matchups for all weeks concurrently, keeping weeks with scoring data."""
+    all_matchups = api.get_season_matchups(league_id, weeks, final_weeks=final_weeks)
+    return {
+        week: matchups
+        for week, matchups in all_matchups.items()
+        if has_scoring_data(matchups)
+    }
+
+
+def build_team_names(users: list[dict]) -> dict[str, str]:
+    """Build user_id -> team_name mapping."""
+    team_names: dict[str, str] = {}
+    for u in users:
+        uid = u.get("user_id")
+        metadata = u.get("metadata") or {}
+        team_names[uid] = metadata.get("team_name") or u.get("display_name", uid)
+    return team_names
+
+
+def load_league(
+    api: SleeperAPI,
+    league_id: str,
+    max_week: int | None = None,
+    refresh_players: bool = False,
+    console: "Console | None" = None,
+    state: dict | None = None,
+    engine: str = "python",
+) -> LeagueData:
+    """
+    Fetch all data needed to render any team in a league.
+
+    Finalized weeks and completed leagues are served from the API's disk
+    cache, so only live data is requested. Per-week rankings and roster
+    membership are kept in a SeasonState saved next to it, so only new or
+    changed weeks are recomputed.
+
+    Args:
+        max_week: Max week to include (default: last week with scoring data)
+        refresh_players: Download the player database again, ignoring the cache
+        console: Optional console for progress messages
+        state: NFL state from get_state (fetched if not provided)
+        engine: Ranking engine (see rankings.rank_season)
+    """
+
+    def status(message: str) -> None:
+        if console is not None:
+            console.print(f"[dim]{message}[/dim]")
+
+    with stage(api.profiler, "fetch"):
+        if state is None:
+            state = api.get_state("nfl")
+        league = api.get_league(league_id)
+        progress = season_status(state, league)
+
+        status("Fetching rosters...")
+        rosters = api.get_rosters(league_id, final=progress.complete)
+        users = api.get_users(league_id, final=progress.complete)
+
+        status("Fetching matchups...")
+        weekly_matchups = fetch_weekly_matchups(
+            api, league_id, progress.weeks, final_weeks=progress.final_weeks
+        )
+
+    # Determine max week from actual data
+    if not max_week:
+        max_week = max(weekly_matchups.keys()) if weekly_matchups else 1
+    status(f"Found data for weeks 1-{max_week}")
+
+    status("Loading player database...")
+    with stage(api.profiler, "index"):
+        players = api.get_player_index("nfl", refresh=refresh_players)
+
+    # Apply only new or changed weeks to the saved season state
+    with stage(api.profiler, "rank"):
+        state_path = SeasonState.path(api.cache_dir, league_id) if api.cache_dir else None
+        season_state = (
+            SeasonState.load(state_path, league_id) if state_path else SeasonState(league_id)
+        )
+        season_state.update(
+            weekly_matchups, players, final_weeks=progress.final_weeks, engine=engine
+        )
+        if state_path and season_state.dirty:
+            season_state.save(state_path)
+
+    return LeagueData(
+        league_id=league_id,
+        name=league.get("name", "Unknown League"),
+        season=str(league.get("season", "")),
+        rosters=rosters,
+        team_names=build_team_names(users),
+        weekly_matchups=weekly_matchups,
+        max_week=max_week,
+        players=players,
+        rankings=LeagueRankings(
+            weekly_matchups, players, max_week, precomputed=season_state.rankings()
+        ),
+        roster_index=season_state.roster_index(),
+        season_state=season_state,
+        complete=progress.complete,
+    )
+
+
+class LeagueCache:
+    """
+    Thread-safe cache so each league is loaded once and shared.
+
+    Args:
+        state: NFL state passed to load_league (fetched per load if None)
+        engine: Ranking engine (see rankings.rank_season)
+        max_age: Seconds before a league that is still in progress is
+                 reloaded (None keeps every league forever)
+    """
+
+    def __init__(
+        self,
+        api: SleeperAPI,
+        state: dict | None = None,
+        engine: str = "python",
+        max_age: float | None = None,
+    ):
+        self.api = api
+        self.state = state
+        self.engine = engine
+        self.max_age = max_age
+        self._lock = threading.Lock()
+        self._leagues: dict[str, tuple[Future, float]] = {}
+
+    def get(self, league_id: str) -> LeagueData:
+        """Get a league, loading it if no other caller has (or it has expired)."""
+        with self._lock:
+            entry = self._leagues.get(league_id)
+            if entry is not None and self._expired(*entry):
+                entry = None
+            owner = entry is None
+            if owner:
+                entry = (Future(), time.monotonic())
+                self._leagues[league_id] = entry
+        future = entry[0]
+
+        if owner:
+            try:
+                future.set_result(
+                    load_league(self.api, league_id, state=self.state, engine=self.engine)
+                )
+            except Exception as e:
+                future.set_exception(e)
+                # Let the next caller retry instead of caching the failure
+                with self._lock:
+                    if self._leagues.get(league_id) is entry:
+                        del self._leagues[league_id]
+        return future.result()
+
+    def discard(self, league_id: str) -> None:
+        """Drop a league so its data can be freed; it is loaded again if asked for."""
+        with self._lock:
+            self._leagues.pop(league_id, None)
+
+    def _expired(self, future: Future, loaded_at: float) -> bool:
+        """Check whether a cached in-progress league is too old to serve."""
+        if self.max_age is None or not future.done() or future.exception():
+            return False
+        if future.result().complete:
+            return False
+        return time.monotonic() - loaded_at > self.max_age
+
+
+def apply_week(league: LeagueData, week: int, matchups: list[dict]) -> None:
+    """Update a loaded league with new matchups for one week, re-ranking only that week."""
+    league.rankings.update_week(week, matchups)
+    league.roster_index.replace_week(week, week_rosters(matchups))
+    league.max_week = max(league.max_week, week)
+
+
+def build_team_report(
+    league: LeagueData, roster: dict, default_name: str | None = None
+) -> TeamReport:
+    """
+    Build performance results for one roster in a league.
+
+    Args:
+        default_name: Team name used when the owner has no name in the league
+    """
+    roster_id = roster.get("roster_id")
+    owner_id = roster.get("owner_id")
+    team_name = league.team_names.get(owner_id) or default_name or f"Team {roster_id}"
+
+    # Get roster membership by week (to show when players joined/left)
+    roster_weeks = league.roster_index.roster_weeks(roster_id)
+
+    # Get all players from matchup history (not just current roster)
+    roster_players = league.roster_index.roster_players(roster_id)
+
+    # Build performance data (only for weeks player was on roster)
+    results = league.rankings.roster_performance(roster_players, roster_weeks)
+
+    return TeamReport(
+        roster_id=roster_id,
+        owner_id=owner_id,
+        team_name=team_name,
+        results=results,
+        roster_weeks=roster_weeks,
+    )
+
+
+def build_all_team_reports(league: LeagueData) -> list[TeamReport]:
+    """Build results for every roster in a league, ordered by roster_id."""
+    return list(iter_team_reports(league))
+
+
+def iter_team_reports(league: LeagueData) -> Iterator[TeamReport]:
+    """Build each roster's results on demand, ordered by roster_id."""
+    rosters = sorted(league.rosters, key=lambda r: r.get("roster_id") or 0)
+    for roster in rosters:
+        yield build_team_report(league, roster)
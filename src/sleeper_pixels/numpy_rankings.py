@@ -0,0 +1,119 @@
+"""Vectorized ranking engine backed by NumPy (optional dependency)."""
+
+try:
+    import numpy as np
+except ImportError as e:
+    raise ImportError(
+        "The numpy ranking engine requires numpy: "
+        "pip install 'sleeper-pixel-performance[numpy]'"
+    ) from e
+
+from .players import PlayerIndex
+from .rankings import RANKED_POSITIONS, TIER_ORDER, TIER_RANK_LIMITS, Tier
+
+POSITION_CODES = {position: code for code, position in enumerate(RANKED_POSITIONS)}
+
+# One row per (week, player) score
+SCORE_DTYPE = np.dtype(
+    [
+        ("week", np.int16),
+        ("position", np.int8),
+        ("points", np.float64),
+        ("rank", np.int32),
+        ("tier", np.int8),
+    ]
+)
+
+
+def collect_scores(
+    weekly_matchups: dict[int, list[dict]],
+    players: PlayerIndex,
+) -> tuple[np.ndarray, list[str]]:
+    """
+    Flatten a season's scores into a structured array.
+
+    Rows are in matchup order, which is what ties are broken by.
+
+    Returns:
+        Tuple of (scores array with rank/tier unset, player_id per row)
+    """
+    weeks: list[int] = []
+    positions: list[int] = []
+    points: list[float] = []
+    player_ids: list[str] = []
+
+    for week, matchups in weekly_matchups.items():
+        for matchup in matchups:
+            players_points = matchup.get("players_points")
+            if not players_points:
+                continue
+            for player_id, pts in players_points.items():
+                player_info = players.get(player_id)
+                if player_info is None:
+                    continue
+                code = POSITION_CODES.get(player_info.position)
+                if code is None:
+                    continue
+                weeks.append(week)
+                positions.append(code)
+                points.append(pts or 0)
+                player_ids.append(player_id)
+
+    scores = np.zeros(len(player_ids), dtype=SCORE_DTYPE)
+    scores["week"] = weeks
+    scores["position"] = positions
+    scores["points"] = points
+    return scores, player_ids
+
+
+def rank_scores(scores: np.ndarray) -> None:
+    """
+    Fill in rank and tier for every row, in place.
+
+    Rows are grouped by (week, position) and ordered by points descending
+    with ties kept in row order, matching the stable sort used by
+    calculate_weekly_rankings.
+    """
+    n = len(scores)
+    if n == 0:
+        return
+
+    # lexsort sorts by the last key first
+    order = np.lexsort(
+        (np.arange(n), -scores["points"], scores["position"], scores["week"])
+    )
+    group = scores["week"][order].astype(np.int32) * 8 + scores["position"][order]
+
+    # Rank is the offset from the start of each (week, position) group
+    new_group = np.empty(n, dtype=bool)
+    new_group[0] = True
+    np.not_equal(group[1:], group[:-1], out=new_group[1:])
+    starts = np.flatnonzero(new_group)
+    group_start = starts[np.cumsum(new_group) - 1]
+    ranks = np.arange(n) - group_start + 1
+
+    scores["rank"][order] = ranks
+    scores["tier"][order] = np.searchsorted(TIER_RANK_LIMITS, ranks, side="left")
+
+
+def rank_season(
+    weekly_matchups: dict[int, list[dict]],
+    players: PlayerIndex,
+) -> dict[int, dict[str, tuple[str, float, int, Tier]]]:
+    """Rank every week of a season; output matches rankings.rank_season."""
+    scores, player_ids = collect_scores(weekly_matchups, players)
+    rank_scores(scores)
+
+    season: dict[int, dict[str, tuple[str, float, int, Tier]]] = {
+        week: {} for week in weekly_matchups
+    }
+    for player_id, week, code, pts, rank, tier in zip(
+        player_ids,
+        scores["week"].tolist(),
+        scores["position"].tolist(),
+        scores["points"].tolist(),
+        scores["rank"].tolist(),
+        scores["tier"].tolist(),
+    ):
+        season[week][player_id] = (RANKED_POSITIONS[code], pts, rank, TIER_ORDER[tier])
+    return season
@@ -0,0 +1,264 @@
+"""Compact player index holding only the fields rankings need."""
+
+import codecs
+import hashlib
+import json
+import pickle
+import re
+import sys
+from collections.abc import Container, Iterable, Iterator
+from pathlib import Path
+
+from .cache import write_bytes
+
+# Bump when the on-disk layout changes so stale index files are rebuilt
+INDEX_FORMAT_VERSION = 1
+
+
+class PlayerInfo:
+    """Slim record for a single player."""
+
+    __slots__ = ("position", "name")
+
+    def __init__(self, position: str, name: str):
+        self.position = position
+        self.name = name
+
+    def __repr__(self) -> str:
+        return f"PlayerInfo(position={self.position!r}, name={self.name!r})"
+
+
+class PlayerIndex:
+    """
+    Mapping of player_id to PlayerInfo.
+
+    Built from the full Sleeper players database, which carries dozens of
+    fields per player, and keeps only position and display name. Player IDs
+    and positions are interned so repeated strings are shared.
+    """
+
+    def __init__(self, players: dict[str, PlayerInfo] | None = None):
+        self._players: dict[str, PlayerInfo] = players or {}
+        self._fingerprints: dict[tuple[str, ...], str] = {}
+
+    @classmethod
+    def from_players_db(
+        cls, players_db: dict, positions: Container[str] | None = None
+    ) -> "PlayerIndex":
+        """
+        Build an index from the raw /players response.
+
+        Args:
+            players_db: The decoded response
+            positions: Keep only players at these positions (None keeps all)
+        """
+        players: dict[str, PlayerInfo] = {}
+        for player_id, info in players_db.items():
+            if positions is None or info.get("position") in positions:
+                players[sys.intern(player_id)] = _slim(player_id, info)
+        return cls(players)
+
+    @classmethod
+    def from_json_stream(
+        cls, chunks: Iterable[bytes], positions: Container[str] | None = None
+    ) -> "PlayerIndex":
+        """
+        Build an index while parsing a raw /players response body in chunks.
+
+        Only one player's record is decoded at a time, so the full body is
+        never held in memory as bytes, text or a dict.
+
+        Args:
+            chunks: The response body, in pieces of any size
+            positions: Keep only players at these positions (None keeps all)
+        """
+        players: dict[str, PlayerInfo] = {}
+        for player_id, info in iter_players_json(chunks):
+            if positions is None or info.get("position") in positions:
+                players[sys.intern(player_id)] = _slim(player_id, info)
+        return cls(players)
+
+    @classmethod
+    def from_columns(
+        cls, ids: list[str], positions: list[str], names: list[str]
+    ) -> "PlayerIndex":
+        """Build an index from parallel columns."""
+        intern = sys.intern
+        return cls(
+            {
+                intern(player_id): PlayerInfo(intern(position), name)
+                for player_id, position, name in zip(ids, positions, names)
+            }
+        )
+
+    def __contains__(self, player_id: object) -> bool:
+        return player_id in self._players
+
+    def __getitem__(self, player_id: str) -> PlayerInfo:
+        return self._players[player_id]
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._players)
+
+    def __len__(self) -> int:
+        return len(self._players)
+
+    def get(self, player_id: str) -> PlayerInfo | None:
+        """Get a player's info, or None if unknown."""
+        return self._players.get(player_id)
+
+    def fingerprint(self, positions: Iterable[str]) -> str:
+        """
+        Digest of which players are at `positions`, to detect index changes.
+
+        Rankings depend only on this mapping, so two indexes with the same
+        fingerprint rank every week the same way. Computed once per index.
+        """
+        key = tuple(positions)
+        digest = self._fingerprints.get(key)
+        if digest is None:
+            wanted = set(key)
+            entries = sorted(
+                f"{player_id}\t{info.position}"
+                for player_id, info in self._players.items()
+                if info.position in wanted
+            )
+            digest = hashlib.blake2b(
+                "\n".join(entries).encode(), digest_size=16
+            ).hexdigest()
+            self._fingerprints[key] = digest
+        return digest
+
+    def columns(self) -> tuple[list[str], list[str], list[str]]:
+        """Return (ids, positions, names) as parallel lists."""
+        ids = list(self._players)
+        positions = [info.position for info in self._players.values()]
+        names = [info.name for info in self._players.values()]
+        return ids, positions, names
+
+    def save(self, path: Path, source: object = None) -> None:
+        """
+        Write the index to a binary file.
+
+        Args:
+            source: Optional marker describing the data the index was built from,
+                    checked by load() so a stale index is never used.
+        """
+        payload = (INDEX_FORMAT_VERSION, source, *self.columns())
+        write_bytes(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+
+    @classmethod
+    def load(cls, path: Path, source: object = None) -> "PlayerIndex | None":
+        """Load an index written by save(), or None if missing, stale or corrupt."""
+        try:
+            version, saved_source, ids, positions, names = pickle.loads(
+                path.read_bytes()
+            )
+        except (OSError, pickle.UnpicklingError, ValueError, TypeError, EOFError):
+            return None
+        if version != INDEX_FORMAT_VERSION or saved_source != source:
+            return None
+        return cls.from_columns(ids, positions, names)
+
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+
+# The common case between records: a comma and a key with no escapes
+_NEXT_KEY = re.compile(r'[ \t\n\r]*,[ \t\n\r]*"([^"\\]*)"[ \t\n\r]*:')
+
+
+def iter_players_json(chunks: Iterable[bytes]) -> Iterator[tuple[str, dict]]:
+    """
+    Incrementally parse a JSON object of player_id -> record, yielding each pair.
+
+    Raises:
+        ValueError: If the body is not a complete JSON object
+    """
+    decoder = json.JSONDecoder()
+    text = codecs.getincrementaldecoder("utf-8")()
+    buffer = ""
+    pos = 0
+    state = "open"  # open -> key -> colon -> value -> next -> (key...) -> done
+    key = ""
+    final = False
+
+    for chunk in _with_end(chunks):
+        if chunk is None:
+            final = True
+            buffer = buffer[pos:] + text.decode(b"", final=True)
+        else:
+            buffer = buffer[pos:] + text.decode(chunk)
+        pos = 0
+
+        while True:
+            pos = _WHITESPACE.match(buffer, pos).end()
+            if pos == len(buffer):
+                break
+            char = buffer[pos]
+            if state == "open":
+                if char != "{":
+                    raise ValueError("Expected a JSON object of players")
+                pos += 1
+                state = "first"
+            elif state in ("first", "key"):
+                if char == "}" and state == "first":
+                    pos += 1
+                    state = "done"
+                    continue
+                if char != '"':
+                    raise ValueError(f"Expected a player ID at offset {pos}")
+                try:
+                    key, pos = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # Key is split across chunks
+                state = "colon"
+            elif state == "colon":
+                if char != ":":
+                    raise ValueError(f"Expected ':' at offset {pos}")
+                pos += 1
+                state = "value"
+            elif state == "value":
+                try:
+                    value, end = decoder.raw_decode(buffer, pos)
+                except json.JSONDecodeError:
+                    if final:
+                        raise
+                    break  # Record is split across chunks
+                if not final and (end == len(buffer) or buffer[end] in ".eE"):
+                    # A bare number or literal may continue in the next chunk,
+                    # even past a prefix that parses ("1" of "1.5", "1e3")
+                    break
+                pos = end
+                state = "next"
+                if isinstance(value, dict):
+                    yield key, value
+                match = _NEXT_KEY.match(buffer, pos)
+                if match:
+                    key = match.group(1)
+                    pos = match.end()
+                    state = "value"
+            elif state == "next":
+                if char not in ",}":
+                    raise ValueError(f"Expected ',' or '}}' at offset {pos}")
+                pos += 1
+                state = "key" if char == "," else "done"
+            else:
+                raise ValueError(f"Extra data at offset {pos}")
+
+    if state != "done":
+        raise ValueError("Players JSON ended early")
+
+
+def _with_end(chunks: Iterable[bytes]) -> Iterator[bytes | None]:
+    """Yield the chunks, then None to mark the end."""
+    yield from chunks
+    yield None
+
+
+def _slim(player_id: str, info: dict) -> PlayerInfo:
+    """Reduce a raw player record to a PlayerInfo."""
+    position = info.get("position") or "UNKNOWN"
+    name = info.get("full_name") or info.get("last_name") or player_id
+    return PlayerInfo(sys.intern(position), name)
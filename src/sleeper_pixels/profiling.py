@@ -0,0 +1,288 @@
+"""Timing of API requests and pipeline stages."""
+
+import json
+import threading
+import time
+from collections.abc import Iterable, Iterator
+from contextlib import AbstractContextManager, contextmanager, nullcontext
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import TYPE_CHECKING, TypeVar
+
+if TYPE_CHECKING:
+    from rich.console import Console
+
+# Pipeline stages, in the order they run
+STAGES = ("fetch", "index", "rank", "render", "export")
+
+T = TypeVar("T")
+
+
+@dataclass(slots=True)
+class RequestRecord:
+    """One API call. Times are seconds, start is relative to the profiler's creation."""
+
+    endpoint: str
+    status: int | None
+    bytes: int
+    start: float
+    seconds: float
+    source: str  # "network" or "replay"
+    thread: int
+
+
+@dataclass(slots=True)
+class StageRecord:
+    """One timed block of work. CPU time is for the whole process."""
+
+    name: str
+    category: str  # "stage" for pipeline stages, "parse" for JSON decoding
+    start: float
+    wall: float
+    cpu: float
+    thread: int
+
+
+class Profiler:
+    """
+    Collects API request and pipeline stage timings.
+
+    Pass one to SleeperAPI(profiler=...) to record every request and JSON
+    parse, and wrap pipeline work in stage(). Safe to share between threads.
+    """
+
+    def __init__(self):
+        self._origin = time.perf_counter()
+        self._lock = threading.Lock()
+        self.requests: list[RequestRecord] = []
+        self.stages: list[StageRecord] = []
+
+    def elapsed(self) -> float:
+        """Seconds since the profiler was created."""
+        return time.perf_counter() - self._origin
+
+    def record_request(
+        self,
+        endpoint: str,
+        status: int | None,
+        size: int,
+        start: float,
+        source: str = "network",
+        seconds: float | None = None,
+    ) -> None:
+        """
+        Record a request that began at perf_counter() time `start` and just finished.
+
+        Pass `seconds` when the request was not busy the whole time since
+        `start`, such as a body streamed while the caller parsed it.
+        """
+        record = RequestRecord(
+            endpoint=endpoint,
+            status=status,
+            bytes=size,
+            start=start - self._origin,
+            seconds=time.perf_counter() - start if seconds is None else seconds,
+            source=source,
+            thread=threading.get_ident(),
+        )
+        with self._lock:
+            self.requests.append(record)
+
+    @contextmanager
+    def stage(self, name: str, category: str = "stage") -> Iterator[None]:
+        """Time the wall and CPU time of a block."""
+        start = time.perf_counter()
+        cpu_start = time.process_time()
+        try:
+            yield
+        finally:
+            self._record_stage(
+                name,
+                category,
+                start,
+                time.perf_counter() - start,
+                time.process_time() - cpu_start,
+            )
+
+    def consumer_stage(
+        self, items: Iterable[T], name: str, category: str = "stage"
+    ) -> Iterator[T]:
+        """
+        Yield items, timing only the work the consumer does with them.
+
+        Time spent producing each item (such as reading it from the network)
+        is left out, so a streamed body's parsing is timed apart from its
+        download. Recorded as one block once the items run out or the
+        consumer stops.
+        """
+        start = time.perf_counter()
+        wall = cpu = 0.0
+        try:
+            for item in items:
+                item_start = time.perf_counter()
+                cpu_start = time.process_time()
+                yield item
+                wall += time.perf_counter() - item_start
+                cpu += time.process_time() - cpu_start
+        finally:
+            self._record_stage(name, category, start, wall, cpu)
+
+    def _record_stage(
+        self, name: str, category: str, start: float, wall: float, cpu: float
+    ) -> None:
+        """Record a block of work that began at perf_counter() time `start`."""
+        record = StageRecord(
+            name=name,
+            category=category,
+            start=start - self._origin,
+            wall=wall,
+            cpu=cpu,
+            thread=threading.get_ident(),
+        )
+        with self._lock:
+            self.stages.append(record)
+
+    def summary(self) -> dict:
+        """Aggregate timings by stage and by endpoint pattern."""
+        stages: dict[str, dict] = {}
+        for record in self.stages:
+            name = record.name if record.category == "stage" else record.category
+            totals = stages.setdefault(name, {"calls": 0, "wall": 0.0, "cpu": 0.0})
+            totals["calls"] += 1
+            totals["wall"] += record.wall
+            totals["cpu"] += record.cpu
+
+        endpoints: dict[str, dict] = {}
+        for record in self.requests:
+            totals = endpoints.setdefault(
+                endpoint_pattern(record.endpoint),
+                {"calls": 0, "bytes": 0, "seconds": 0.0, "max": 0.0, "errors": 0},
+            )
+            totals["calls"] += 1
+            totals["bytes"] += record.bytes
+            totals["seconds"] += record.seconds
+            totals["max"] = max(totals["max"], record.seconds)
+            if record.status is None or record.status >= 400:
+                totals["errors"] += 1
+
+        return {"total": self.elapsed(), "stages": stages, "endpoints": endpoints}
+
+    def to_json(self) -> dict:
+        """All records plus the summary, as plain data."""
+        return {
+            "summary": self.summary(),
+            "requests": [asdict(r) for r in self.requests],
+            "stages": [asdict(s) for s in self.stages],
+        }
+
+    def to_chrome_trace(self) -> dict:
+        """Records in Chrome trace event format (chrome://tracing, Perfetto)."""
+        threads: dict[int, int] = {}
+        events = []
+
+        def tid(thread: int) -> int:
+            return threads.setdefault(thread, len(threads) + 1)
+
+        for s in self.stages:
+            events.append(
+                {
+                    "name": s.name,
+                    "cat": s.category,
+                    "ph": "X",
+                    "ts": s.start * 1e6,
+                    "dur": s.wall * 1e6,
+                    "pid": 1,
+                    "tid": tid(s.thread),
+                    "args": {"cpu_ms": round(s.cpu * 1000, 3)},
+                }
+            )
+        for r in self.requests:
+            events.append(
+                {
+                    "name": r.endpoint,
+                    "cat": "request",
+                    "ph": "X",
+                    "ts": r.start * 1e6,
+                    "dur": r.seconds * 1e6,
+                    "pid": 1,
+                    "tid": tid(r.thread),
+                    "args": {"status": r.status, "bytes": r.bytes, "source": r.source},
+                }
+            )
+        for thread, number in threads.items():
+            name = "main" if thread == threading.main_thread().ident else f"worker {number}"
+            events.append(
+                {"name": "thread_name", "ph": "M", "pid": 1, "tid": number, "args": {"name": name}}
+            )
+
+        return {"traceEvents": events, "displayTimeUnit": "ms"}
+
+    def write_json(self, path: Path) -> None:
+        """Write to_json() to a file."""
+        path.write_text(json.dumps(self.to_json(), indent=2) + "\n")
+
+    def write_chrome_trace(self, path: Path) -> None:
+        """Write to_chrome_trace() to a file."""
+        path.write_text(json.dumps(self.to_chrome_trace()) + "\n")
+
+    def render(self, console: "Console") -> None:
+        """Print summary tables of stages and requests."""
+        from rich.table import Table
+
+        summary = self.summary()
+
+        stages = Table(title="Profile: Stages", header_style="bold")
+        stages.add_column("Stage", style="cyan")
+        stages.add_column("Calls", justify="right")
+        stages.add_column("Wall", justify="right")
+        stages.add_column("CPU", justify="right")
+        order = {name: i for i, name in enumerate(STAGES)}
+        for name, totals in sorted(
+            summary["stages"].items(), key=lambda item: order.get(item[0], len(order))
+        ):
+            label = "JSON parse" if name == "parse" else name
+            stages.add_row(
+                label,
+                str(totals["calls"]),
+                f"{totals['wall'] * 1000:.1f}ms",
+                f"{totals['cpu'] * 1000:.1f}ms",
+            )
+        stages.add_row("[bold]total[/bold]", "", f"{summary['total'] * 1000:.1f}ms", "")
+        console.print(stages)
+
+        if not summary["endpoints"]:
+            return
+        requests = Table(title="Profile: Requests", header_style="bold")
+        requests.add_column("Endpoint", style="cyan")
+        requests.add_column("Calls", justify="right")
+        requests.add_column("Bytes", justify="right")
+        requests.add_column("Total", justify="right")
+        requests.add_column("Max", justify="right")
+        requests.add_column("Errors", justify="right")
+        for pattern, totals in sorted(
+            summary["endpoints"].items(), key=lambda item: -item[1]["seconds"]
+        ):
+            requests.add_row(
+                pattern,
+                str(totals["calls"]),
+                f"{totals['bytes']:,}",
+                f"{totals['seconds'] * 1000:.1f}ms",
+                f"{totals['max'] * 1000:.1f}ms",
+                str(totals["errors"]) if totals["errors"] else "",
+            )
+        console.print(requests)
+
+
+def stage(profiler: Profiler | None, name: str) -> AbstractContextManager:
+    """Time a block as a pipeline stage if profiling, else do nothing."""
+    return profiler.stage(name) if profiler is not None else nullcontext()
+
+
+def endpoint_pattern(endpoint: str) -> str:
+    """Group endpoints by replacing IDs, usernames and numbers with '*'."""
+    parts = endpoint.strip("/").split("/")
+    pattern = [
+        "*" if (i == 1 and parts[0] in ("user", "league")) or part.isdigit() else part
+        for i, part in enumerate(parts)
+    ]
+    return "/" + "/".join(pattern)
@@ -3,6 +3,12 @@
 from collections import defaultdict
 from dataclasses import dataclass
 from enum import Enum
+from typing import TYPE_CHECKING
+
+from .players import PlayerIndex
+
+if TYPE_CHECKING:
+    from .results import SeasonResults
 
 
 class Tier(Enum):
@@ -14,7 +20,18 @@ class Tier(Enum):
     AVERAGE = "average"  # Below top 15
 
 
-@dataclass
+# Positions that are ranked
+RANKED_POSITIONS = ("QB", "RB", "WR", "TE", "K", "DEF")
+
+# Tiers from best to worst, and the lowest rank in each (beyond the last is AVERAGE)
+TIER_ORDER = (Tier.ELITE, Tier.GREAT, Tier.GOOD, Tier.AVERAGE)
+TIER_RANK_LIMITS = (5, 10, 15)
+
+# Available engines for rank_season
+RANKING_ENGINES = ("python", "numpy")
+
+
+@dataclass(slots=True)
 class PlayerWeekResult:
     """A player's performance for a single week."""
 
@@ -41,8 +58,8 @@ def get_tier(rank: int) -> Tier:
 
 def calculate_weekly_rankings(
     matchups: list[dict],
-    players_db: dict,
-) -> dict[str, list[tuple[str, float, int, Tier]]]:
+    players: PlayerIndex,
+) -> dict[str, tuple[str, float, int, Tier]]:
     """
     Calculate positional rankings for all players in a week's matchups.
 
@@ -58,11 +75,11 @@ def calculate_weekly_rankings(
             continue
 
         for player_id, points in players_points.items():
-            if player_id not in players_db:
+            player_info = players.get(player_id)
+            if player_info is None:
                 continue
-            player_info = players_db[player_id]
-            position = player_info.get("position", "UNKNOWN")
-            if position in ("QB", "RB", "WR", "TE", "K", "DEF"):
+            position = player_info.position
+            if position in RANKED_POSITIONS:
                 position_scores[position].append((player_id, points or 0))
 
     # Rank players within each position
@@ -79,62 +96,149 @@ def calculate_weekly_rankings(
     return player_rankings
 
 
+def rank_season(
+    weekly_matchups: dict[int, list[dict]],
+    players: PlayerIndex,
+    engine: str = "python",
+) -> dict[int, dict[str, tuple[str, float, int, Tier]]]:
+    """
+    Calculate positional rankings for every week in a season.
+
+    Args:
+        engine: "python" ranks week by week with calculate_weekly_rankings;
+                "numpy" ranks all weeks and positions in a few batched sorts
+                (requires numpy, and pays off for large or many seasons).
+
+    Returns:
+        Dict mapping week to calculate_weekly_rankings output
+    """
+    if engine == "numpy":
+        from .numpy_rankings import rank_season as rank_season_numpy
+
+        return rank_season_numpy(weekly_matchups, players)
+    if engine != "python":
+        raise ValueError(f"Unknown ranking engine: {engine}")
+    return {
+        week: calculate_weekly_rankings(matchups, players)
+        for week, matchups in weekly_matchups.items()
+    }
+
+
+class LeagueRankings:
+    """
+    Positional rankings for every week of a league.
+
+    Rankings are league-wide, so each week is ranked once (on first use) and
+    shared by every roster built from this object.
+
+    Args:
+        precomputed: Optional rankings keyed by week (e.g. from a saved
+                     SeasonState); those weeks are not ranked again.
+    """
+
+    def __init__(
+        self,
+        weekly_matchups: dict[int, list[dict]],
+        players: PlayerIndex,
+        max_week: int,
+        precomputed: dict[int, dict[str, tuple[str, float, int, Tier]]] | None = None,
+    ):
+        self.weekly_matchups = weekly_matchups
+        self.players = players
+        self.max_week = max_week
+        self._weeks: dict[int, dict[str, tuple[str, float, int, Tier]]] = dict(
+            precomputed or {}
+        )
+
+    def week(self, week: int) -> dict[str, tuple[str, float, int, Tier]]:
+        """Get rankings for a week, mapping player_id to (position, points, rank, tier)."""
+        rankings = self._weeks.get(week)
+        if rankings is None:
+            matchups = self.weekly_matchups.get(week, [])
+            rankings = calculate_weekly_rankings(matchups, self.players)
+            self._weeks[week] = rankings
+        return rankings
+
+    def update_week(self, week: int, matchups: list[dict]) -> None:
+        """Replace one week's matchups and re-rank only that week."""
+        self.weekly_matchups[week] = matchups
+        self._weeks[week] = calculate_weekly_rankings(matchups, self.players)
+        self.max_week = max(self.max_week, week)
+
+    def roster_performance(
+        self,
+        roster_players: list[str],
+        roster_weeks: dict[str, set[int]] | None = None,
+    ) -> "SeasonResults":
+        """
+        Build performance data for all players on a roster across all weeks.
+
+        Args:
+            roster_players: List of player IDs on the roster
+            roster_weeks: Optional dict mapping player_id to set of weeks on roster.
+                          If provided, only includes results for weeks player was rostered.
+
+        Returns:
+            SeasonResults with a row for each player/week combination
+        """
+        # Imported here because results depends on this module
+        from .results import SeasonResults
+
+        results = SeasonResults()
+
+        for week in range(1, self.max_week + 1):
+            if not self.weekly_matchups.get(week):
+                continue
+
+            rankings = self.week(week)
+
+            for player_id in roster_players:
+                player_info = self.players.get(player_id)
+                if player_info is None:
+                    continue
+
+                # Skip if player wasn't on roster this week
+                if roster_weeks and week not in roster_weeks.get(player_id, set()):
+                    continue
+
+                if player_id in rankings:
+                    pos, points, rank, tier = rankings[player_id]
+                    results.add(
+                        player_id,
+                        player_info.name,
+                        player_info.position,
+                        week,
+                        points,
+                        rank,
+                        tier,
+                    )
+
+        return results
+
+
 def build_roster_performance(
     roster_players: list[str],
     weekly_matchups: dict[int, list[dict]],
-    players_db: dict,
+    players: PlayerIndex,
     max_week: int,
     roster_weeks: dict[str, set[int]] | None = None,
-) -> list[PlayerWeekResult]:
+) -> "SeasonResults":
     """
     Build performance data for all players on a roster across all weeks.
 
+    Convenience wrapper for a single roster; use LeagueRankings directly when
+    building results for several rosters in the same league.
+
     Args:
         roster_players: List of player IDs on the roster
         weekly_matchups: Dict mapping week number to matchup data
-        players_db: Full player database
+        players: Player index (see SleeperAPI.get_player_index)
         max_week: Maximum week number to process
         roster_weeks: Optional dict mapping player_id to set of weeks on roster.
                       If provided, only includes results for weeks player was rostered.
 
     Returns:
-        List of PlayerWeekResult for each player/week combination
+        SeasonResults with a row for each player/week combination
     """
-    results = []
-
-    for week in range(1, max_week + 1):
-        matchups = weekly_matchups.get(week, [])
-        if not matchups:
-            continue
-
-        rankings = calculate_weekly_rankings(matchups, players_db)
-
-        for player_id in roster_players:
-            if player_id not in players_db:
-                continue
-
-            # Skip if player wasn't on roster this week
-            if roster_weeks and week not in roster_weeks.get(player_id, set()):
-                continue
-
-            player_info = players_db[player_id]
-            player_name = player_info.get("full_name") or player_info.get(
-                "last_name", player_id
-            )
-            position = player_info.get("position", "UNKNOWN")
-
-            if player_id in rankings:
-                pos, points, rank, tier = rankings[player_id]
-                results.append(
-                    PlayerWeekResult(
-                        player_id=player_id,
-                        player_name=player_name,
-                        position=position,
-                        week=week,
-                        points=points,
-                        rank=rank,
-                        tier=tier,
-                    )
-                )
-
-    return results
+    league_rankings = LeagueRankings(weekly_matchups, players, max_week)
+    return league_rankings.roster_performance(roster_players, roster_weeks)
@@ -0,0 +1,78 @@
+"""Client-side rate limiting and retry backoff."""
+
+import random
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket that adapts to throttling.
+
+    Allows bursts of up to `burst` requests, refilled at `rate` per second.
+    After throttle() (e.g. on HTTP 429) the rate is halved; each success
+    then raises it a little, back up to the configured rate, so throughput
+    settles near the highest rate the server accepts.
+
+    Args:
+        rate: Requests per second
+        burst: Max requests allowed at once after a quiet period
+    """
+
+    def __init__(self, rate: float, burst: int = 1):
+        if rate <= 0:
+            raise ValueError("rate must be positive")
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = max(1, burst)
+        self._tokens = float(self.burst)
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> None:
+        """Wait until a request may be sent."""
+        while True:
+            with self._lock:
+                now = time.monotonic()
+                self._tokens = min(
+                    self.burst, self._tokens + (now - self._updated) * self.rate
+                )
+                self._updated = now
+                if self._tokens >= 1:
+                    self._tokens -= 1
+                    return
+                wait = (1 - self._tokens) / self.rate
+            time.sleep(wait)
+
+    def throttle(self) -> None:
+        """Slow down after the server rejected a request for going too fast."""
+        with self._lock:
+            self.rate = max(self.max_rate / 64, self.rate / 2)
+            self._tokens = min(self._tokens, 0.0)
+
+    def succeed(self) -> None:
+        """Speed back up gradually after a request went through."""
+        if self.rate < self.max_rate:
+            with self._lock:
+                self.rate = min(self.max_rate, self.rate + self.max_rate / 32)
+
+
+def backoff_delay(
+    attempt: int,
+    base: float = 0.5,
+    cap: float = 30.0,
+    retry_after: str | None = None,
+) -> float:
+    """
+    Seconds to wait before retry number `attempt` (starting at 1).
+
+    Uses exponential backoff with full jitter, so clients that failed
+    together don't retry together. A numeric Retry-After header from the
+    server takes precedence.
+    """
+    if retry_after:
+        try:
+            return min(cap, max(0.0, float(retry_after)))
+        except ValueError:
+            pass  # HTTP-date form; fall back to backoff
+    return random.uniform(0, min(cap, base * 2 ** (attempt - 1)))
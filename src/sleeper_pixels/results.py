@@ -0,0 +1,162 @@
+"""Columnar storage for a roster's season of player-week results."""
+
+import pickle
+from array import array
+from collections.abc import Iterable, Iterator
+
+from .rankings import TIER_ORDER, PlayerWeekResult, Tier
+
+# Tier -> small integer code stored in the tier column
+TIER_CODES = {tier: code for code, tier in enumerate(TIER_ORDER)}
+
+# Bump when the serialized layout changes
+RESULTS_FORMAT_VERSION = 1
+
+
+class SeasonResults:
+    """
+    Player-week results stored as typed columns.
+
+    Each result is a row across the player, week, points, rank and tier
+    columns; player is an index into the player_ids/player_names/positions
+    tables, so per-player strings are stored once rather than per week.
+    Iterating yields PlayerWeekResult objects for code that wants them.
+    """
+
+    def __init__(self):
+        self.player_ids: list[str] = []
+        self.player_names: list[str] = []
+        self.positions: list[str] = []
+        self._player_rows: dict[str, int] = {}
+
+        self.player = array("I")
+        self.week = array("H")
+        self.points = array("d")
+        self.rank = array("H")
+        self.tier = array("B")
+
+    @classmethod
+    def from_results(cls, results: Iterable[PlayerWeekResult]) -> "SeasonResults":
+        """Build from PlayerWeekResult objects."""
+        season = cls()
+        for r in results:
+            season.add(r.player_id, r.player_name, r.position, r.week, r.points, r.rank, r.tier)
+        return season
+
+    def add_player(self, player_id: str, name: str, position: str) -> int:
+        """Get a player's index, adding them to the player tables if new."""
+        player = self._player_rows.get(player_id)
+        if player is None:
+            player = len(self.player_ids)
+            self._player_rows[player_id] = player
+            self.player_ids.append(player_id)
+            self.player_names.append(name)
+            self.positions.append(position)
+        return player
+
+    def add(
+        self,
+        player_id: str,
+        name: str,
+        position: str,
+        week: int,
+        points: float,
+        rank: int,
+        tier: Tier,
+    ) -> None:
+        """Append one player-week result."""
+        self.player.append(self.add_player(player_id, name, position))
+        self.week.append(week)
+        self.points.append(points)
+        self.rank.append(rank)
+        self.tier.append(TIER_CODES[tier])
+
+    def __len__(self) -> int:
+        return len(self.week)
+
+    def __iter__(self) -> Iterator[PlayerWeekResult]:
+        for row in range(len(self)):
+            yield self.result(row)
+
+    def result(self, row: int) -> PlayerWeekResult:
+        """Get a single row as a PlayerWeekResult."""
+        player = self.player[row]
+        return PlayerWeekResult(
+            player_id=self.player_ids[player],
+            player_name=self.player_names[player],
+            position=self.positions[player],
+            week=self.week[row],
+            points=self.points[row],
+            rank=self.rank[row],
+            tier=TIER_ORDER[self.tier[row]],
+        )
+
+    def tier_at(self, row: int) -> Tier:
+        """Get the Tier for a row."""
+        return TIER_ORDER[self.tier[row]]
+
+    def matrix(self, max_week: int) -> list[array]:
+        """
+        Player-by-week view of the rows.
+
+        Returns:
+            One array per player (indexed like player_ids) holding, for each
+            week 1..max_week, the row of that week's result or -1 if none.
+        """
+        cells = [array("i", [-1]) * max_week for _ in self.player_ids]
+        for row, (player, week) in enumerate(zip(self.player, self.week)):
+            if 1 <= week <= max_week:
+                cells[player][week - 1] = row
+        return cells
+
+    def to_bytes(self) -> bytes:
+        """Serialize to a compact binary form."""
+        payload = (
+            RESULTS_FORMAT_VERSION,
+            self.player_ids,
+            self.player_names,
+            self.positions,
+            self.player,
+            self.week,
+            self.points,
+            self.rank,
+            self.tier,
+        )
+        return pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL)
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "SeasonResults":
+        """Load results written by to_bytes()."""
+        version, *fields = pickle.loads(data)
+        if version != RESULTS_FORMAT_VERSION:
+            raise ValueError(f"Unsupported results format version: {version}")
+        season = cls()
+        (
+            season.player_ids,
+            season.player_names,
+            season.positions,
+            season.player,
+            season.week,
+            season.points,
+            season.rank,
+            season.tier,
+        ) = fields
+        season._player_rows = {pid: i for i, pid in enumerate(season.player_ids)}
+        return season
+
+
+def pack_weeks(weeks: Iterable[int]) -> int:
+    """Pack a set of week numbers into one integer bitmask."""
+    return sum(1 << week for week in set(weeks))
+
+
+def unpack_weeks(mask: int) -> set[int]:
+    """Expand a bitmask from pack_weeks() back into a set of weeks."""
+    weeks = set()
+    week = 0
+    while mask:
+        if mask & 1:
+            weeks.add(week)
+        mask >>= 1
+        week += 1
+    return weeks
@@ -0,0 +1,166 @@
+"""Persisted per-league season state, updated one week at a time."""
+
+import hashlib
+import json
+import pickle
+from collections.abc import Container
+from dataclasses import dataclass
+from pathlib import Path
+
+from .cache import write_bytes
+from .index import RosterIndex
+from .players import PlayerIndex
+from .rankings import RANKED_POSITIONS, Tier, rank_season
+
+# Bump when the on-disk layout changes so stale state files are rebuilt
+STATE_FORMAT_VERSION = 2
+
+
+@dataclass
+class WeekState:
+    """Computed data for a single week of a league."""
+
+    fingerprint: str  # Digest of the week's matchups
+    final: bool  # Week can no longer change
+    rankings: dict[str, tuple[str, float, int, Tier]]
+    rosters: dict[int, list[str]]  # roster_id -> player_ids that week
+
+
+def week_fingerprint(matchups: list[dict]) -> str:
+    """Digest a week's matchups to detect changes."""
+    return hashlib.blake2b(json.dumps(matchups).encode(), digest_size=16).hexdigest()
+
+
+def week_rosters(matchups: list[dict]) -> dict[int, list[str]]:
+    """Get each roster's players for a week."""
+    return {
+        m["roster_id"]: list(m.get("players") or [])
+        for m in matchups
+        if m.get("roster_id") is not None
+    }
+
+
+class SeasonState:
+    """
+    Per-week rankings and roster membership for one league's season.
+
+    update() recomputes only weeks that are new or whose matchups changed,
+    so refreshing during the season costs one week of work rather than the
+    whole season. Weeks already stored as final are not even re-hashed.
+    Rankings also depend on player positions, so every week is recomputed
+    when the player index differs from the one they were ranked with.
+    """
+
+    def __init__(
+        self,
+        league_id: str,
+        weeks: dict[int, WeekState] | None = None,
+        players_fingerprint: str | None = None,
+    ):
+        self.league_id = league_id
+        self.weeks: dict[int, WeekState] = weeks or {}
+        self.players_fingerprint = players_fingerprint
+        self.dirty = False
+
+    @staticmethod
+    def path(cache_dir: Path, league_id: str) -> Path:
+        """Location of a league's state file under a cache directory."""
+        return cache_dir / "seasons" / f"{league_id}.pickle"
+
+    @classmethod
+    def load(cls, path: Path, league_id: str) -> "SeasonState":
+        """Load saved state, or start empty if missing, stale or corrupt."""
+        try:
+            version, *fields = pickle.loads(path.read_bytes())
+        except (OSError, pickle.UnpicklingError, ValueError, TypeError, EOFError):
+            return cls(league_id)
+        if version != STATE_FORMAT_VERSION:
+            return cls(league_id)
+        saved_league_id, players_fingerprint, weeks = fields
+        if saved_league_id != league_id:
+            return cls(league_id)
+        return cls(league_id, weeks, players_fingerprint)
+
+    def save(self, path: Path) -> None:
+        """Write state to disk."""
+        payload = (
+            STATE_FORMAT_VERSION,
+            self.league_id,
+            self.players_fingerprint,
+            self.weeks,
+        )
+        write_bytes(path, pickle.dumps(payload, protocol=pickle.HIGHEST_PROTOCOL))
+        self.dirty = False
+
+    def update(
+        self,
+        weekly_matchups: dict[int, list[dict]],
+        players: PlayerIndex,
+        final_weeks: Container[int] = (),
+        engine: str = "python",
+    ) -> list[int]:
+        """
+        Apply new or changed weeks.
+
+        Args:
+            weekly_matchups: Dict mapping week number to matchup data
+            players: Player index used for rankings
+            final_weeks: Weeks whose matchups can no longer change
+            engine: Ranking engine (see rankings.rank_season)
+
+        Returns:
+            Weeks that were (re)computed
+        """
+        # Rankings made with a different player index may be wrong
+        players_fingerprint = players.fingerprint(RANKED_POSITIONS)
+        if players_fingerprint != self.players_fingerprint:
+            self.weeks.clear()
+            self.players_fingerprint = players_fingerprint
+            self.dirty = True
+
+        for week in [w for w in self.weeks if w not in weekly_matchups]:
+            del self.weeks[week]
+            self.dirty = True
+
+        changed: dict[int, str] = {}
+        for week, matchups in weekly_matchups.items():
+            existing = self.weeks.get(week)
+            if existing is not None and existing.final:
+                continue
+
+            fingerprint = week_fingerprint(matchups)
+            # Rank a week once more as it becomes final, since it is never
+            # checked again after that
+            if (
+                existing is not None
+                and existing.fingerprint == fingerprint
+                and week not in final_weeks
+            ):
+                continue
+            changed[week] = fingerprint
+
+        # Rank all changed weeks together so batched engines can be used
+        rankings = rank_season(
+            {week: weekly_matchups[week] for week in changed}, players, engine=engine
+        )
+        for week, fingerprint in changed.items():
+            self.weeks[week] = WeekState(
+                fingerprint=fingerprint,
+                final=week in final_weeks,
+                rankings=rankings[week],
+                rosters=week_rosters(weekly_matchups[week]),
+            )
+
+        if changed:
+            self.dirty = True
+        return list(changed)
+
+    def rankings(self) -> dict[int, dict[str, tuple[str, float, int, Tier]]]:
+        """Get stored rankings keyed by week."""
+        return {week: state.rankings for week, state in self.weeks.items()}
+
+    def roster_index(self) -> RosterIndex:
+        """Get roster membership for the stored weeks."""
+        return RosterIndex.from_week_rosters(
+            {week: state.rosters for week, state in self.weeks.items()}
+        )
@@ -0,0 +1,255 @@
+"""Local HTTP server for pixel grids."""
+
+import argparse
+import hashlib
+import re
+import threading
+from collections import OrderedDict
+from http import HTTPStatus
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, unquote, urlsplit
+
+from rich.console import Console
+
+from .api import SleeperAPI
+from .cli import add_api_arguments, create_api
+from .grid import HTML_STYLES, POSITION_ORDER, render_html
+from .league import LeagueCache, LeagueData, build_team_report
+
+# Seconds before an in-progress league is refetched
+DEFAULT_REFRESH_SECONDS = 60
+
+# Rendered pages kept in memory, keyed by ETag
+PAGE_CACHE_SIZE = 256
+
+# Path values reach API endpoints and cache file names, so only the shapes
+# Sleeper uses are accepted (usernames are percent-encoded by the client)
+SEASON_PATTERN = re.compile(r"[0-9]{4}")
+LEAGUE_ID_PATTERN = re.compile(r"[0-9]{1,32}")
+
+
+class GridServer:
+    """Shared state for all requests: one API client, player index and league cache."""
+
+    def __init__(
+        self,
+        api: SleeperAPI,
+        refresh: float = DEFAULT_REFRESH_SECONDS,
+        html_style: str = "inline",
+    ):
+        self.api = api
+        self.html_style = html_style
+        self.leagues = LeagueCache(api, max_age=refresh)
+        self._lock = threading.Lock()
+        self._user_ids: dict[str, tuple[str, str]] = {}
+        self._pages: OrderedDict[str, bytes] = OrderedDict()
+
+    def get_user(self, username: str) -> tuple[str, str]:
+        """Get (user_id, display_name) for a username, cached for the server's life."""
+        key = username.lower()
+        with self._lock:
+            cached = self._user_ids.get(key)
+        if cached is not None:
+            return cached
+
+        user = self.api.get_user(username)
+        if not user:
+            raise LookupError(f"User '{username}' not found")
+        cached = (user["user_id"], user.get("display_name", username))
+        with self._lock:
+            self._user_ids[key] = cached
+        return cached
+
+    def page(
+        self,
+        username: str,
+        season: str,
+        league_id: str,
+        positions: list[str] | None = None,
+        if_none_match: str | None = None,
+    ) -> tuple[str, bytes | None]:
+        """
+        Render a user's grid for a league.
+
+        Returns:
+            Tuple of (etag, body); body is None if the client's copy matches
+        """
+        user_id, display_name = self.get_user(username)
+        league = self.leagues.get(league_id)
+        if league.season and league.season != season:
+            raise LookupError(f"League {league_id} is not a {season} league")
+
+        roster = next((r for r in league.rosters if r.get("owner_id") == user_id), None)
+        if not roster or not roster.get("roster_id"):
+            raise LookupError(f"{username} has no roster in league {league_id}")
+
+        etag = page_etag(league, roster, display_name, positions, self.html_style)
+        if if_none_match and etag in [t.strip() for t in if_none_match.split(",")]:
+            return etag, None
+
+        with self._lock:
+            body = self._pages.get(etag)
+            if body is not None:
+                self._pages.move_to_end(etag)
+        if body is None:
+            report = build_team_report(league, roster, default_name=display_name)
+            body = render_html(
+                report.results,
+                report.team_name,
+                league.season or season,
+                league.max_week,
+                position_filter=positions,
+                roster_weeks=report.roster_weeks,
+                style=self.html_style,
+            ).encode()
+            with self._lock:
+                self._pages[etag] = body
+                while len(self._pages) > PAGE_CACHE_SIZE:
+                    self._pages.popitem(last=False)
+        return etag, body
+
+
+def page_etag(
+    league: LeagueData,
+    roster: dict,
+    display_name: str,
+    positions: list[str] | None,
+    html_style: str = "inline",
+) -> str:
+    """Derive an ETag from the week data and options a page is rendered from."""
+    digest = hashlib.blake2b(digest_size=16)
+    parts = [
+        league.league_id,
+        league.name,
+        str(roster.get("roster_id")),
+        league.team_names.get(roster.get("owner_id")) or display_name,
+        str(league.max_week),
+        ",".join(sorted(positions or [])),
+        html_style,
+    ]
+    parts.extend(
+        f"{week}:{state.fingerprint}"
+        for week, state in sorted(league.season_state.weeks.items())
+    )
+    digest.update("\n".join(parts).encode())
+    return f'"{digest.hexdigest()}"'
+
+
+class GridRequestHandler(BaseHTTPRequestHandler):
+    """Serve /u/<username>/<season>/<league>[?position=RB&position=WR]."""
+
+    server_version = "sleeper-pixels"
+    grid_server: GridServer  # Set on a subclass by serve()
+
+    def do_GET(self) -> None:
+        url = urlsplit(self.path)
+        parts = [unquote(p) for p in url.path.strip("/").split("/")]
+        if len(parts) != 4 or parts[0] != "u":
+            self._send_text(
+                HTTPStatus.NOT_FOUND,
+                "Usage: /u/<username>/<season>/<league_id>?position=RB\n",
+            )
+            return
+
+        _, username, season, league_id = parts
+        if (
+            not SEASON_PATTERN.fullmatch(season)
+            or not LEAGUE_ID_PATTERN.fullmatch(league_id)
+            or not username
+        ):
+            self._send_text(HTTPStatus.NOT_FOUND, "Unknown user, season or league\n")
+            return
+        positions = parse_qs(url.query).get("position")
+        if positions and any(p not in POSITION_ORDER for p in positions):
+            self._send_text(HTTPStatus.BAD_REQUEST, "Unknown position\n")
+            return
+
+        try:
+            etag, body = self.grid_server.page(
+                username,
+                season,
+                league_id,
+                positions=positions,
+                if_none_match=self.headers.get("If-None-Match"),
+            )
+        except LookupError as e:
+            self._send_text(HTTPStatus.NOT_FOUND, f"{e}\n")
+            return
+        except Exception as e:
+            self._send_text(HTTPStatus.BAD_GATEWAY, f"Error: {e}\n")
+            return
+
+        if body is None:
+            self.send_response(HTTPStatus.NOT_MODIFIED)
+            self.send_header("ETag", etag)
+            self.end_headers()
+            return
+
+        self.send_response(HTTPStatus.OK)
+        self.send_header("Content-Type", "text/html; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.send_header("ETag", etag)
+        self.send_header("Cache-Control", "no-cache")
+        self.end_headers()
+        self.wfile.write(body)
+
+    def _send_text(self, status: HTTPStatus, message: str) -> None:
+        body = message.encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "text/plain; charset=utf-8")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+
+def serve(grid_server: GridServer, host: str, port: int) -> ThreadingHTTPServer:
+    """Create an HTTP server for a GridServer (call serve_forever() to run it)."""
+    handler = type("Handler", (GridRequestHandler,), {"grid_server": grid_server})
+    return ThreadingHTTPServer((host, port), handler)
+
+
+def main(argv: list[str] | None = None) -> int:
+    """Entry point for `sleeper-pixels serve`."""
+    parser = argparse.ArgumentParser(
+        prog="sleeper-pixels serve",
+        description="Serve pixel grids over HTTP at /u/<username>/<season>/<league_id>",
+    )
+    parser.add_argument(
+        "--host", default="127.0.0.1", help="Address to bind (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--port", type=int, default=8000, help="Port (default: %(default)s)"
+    )
+    parser.add_argument(
+        "--refresh",
+        type=float,
+        default=DEFAULT_REFRESH_SECONDS,
+        metavar="SECONDS",
+        help="Refetch in-progress leagues after this long (default: %(default)g)",
+    )
+    parser.add_argument(
+        "--html-style",
+        choices=HTML_STYLES,
+        default="inline",
+        help="HTML output style (default: %(default)s)",
+    )
+    add_api_arguments(parser)
+
+    args = parser.parse_args(argv)
+    console = Console()
+
+    try:
+        api = create_api(args)
+        console.print("[dim]Loading player database...[/dim]")
+        api.get_player_index("nfl", refresh=args.refresh_players)
+        httpd = serve(GridServer(api, refresh=args.refresh, html_style=args.html_style), args.host, args.port)
+        url = f"http://{args.host}:{args.port}"
+        console.print(f"Serving on {url}/u/<username>/<season>/<league_id>")
+        httpd.serve_forever()
+        return 0
+    except KeyboardInterrupt:
+        console.print("\n[yellow]Stopped.[/yellow]")
+        return 0
+    except Exception as e:
+        console.print(f"[red]Error: {e}[/red]")
+        return 1
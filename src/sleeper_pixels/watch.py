@@ -0,0 +1,136 @@
+"""Live game-day view that polls only the current week."""
+
+import time
+from datetime import datetime
+
+from rich.console import Console, Group
+from rich.live import Live
+from rich.text import Text
+
+from .api import SleeperAPI
+from .fastgrid import build_pixel_grid
+from .grid import build_legend, build_pixel_table
+from .league import SEASON_WEEKS, LeagueData, apply_week, build_team_report, has_scoring_data
+from .season import week_fingerprint
+
+# Seconds between get_state checks (the NFL week changes at most daily)
+STATE_REFRESH_SECONDS = 15 * 60
+
+# Polls in a row with no new scores before polling slows down, so a short
+# lull during a game doesn't delay the next update
+IDLE_POLLS = 3
+
+# Longest wait between polls while a week's scores aren't changing
+MAX_IDLE_INTERVAL = 15 * 60
+
+
+def live_week(state: dict, season: str) -> int | None:
+    """
+    Get the current week of a league's season, or None outside the season.
+
+    get_state only says which week the season is in, not whether games are
+    being played, so this is the whole week, Tuesday to Monday.
+    """
+    if state.get("season_type") not in ("regular", "post"):
+        return None
+    if str(state.get("season", "")) != season:
+        return None
+    week = int(state.get("week") or 0)
+    return week if week in SEASON_WEEKS else None
+
+
+def poll_delay(interval: float, unchanged: int) -> float:
+    """
+    Seconds to wait after `unchanged` polls in a row found no new scores.
+
+    The interval doubles with each unchanged poll after IDLE_POLLS, up to
+    MAX_IDLE_INTERVAL (or the interval itself, if that is longer).
+    """
+    if unchanged < IDLE_POLLS:
+        return interval
+    doublings = min(unchanged - IDLE_POLLS + 1, 32)
+    return min(max(interval, MAX_IDLE_INTERVAL), interval * 2**doublings)
+
+
+def watch_team(
+    api: SleeperAPI,
+    league: LeagueData,
+    roster: dict,
+    interval: float,
+    console: Console,
+    default_name: str | None = None,
+    show_points: bool = False,
+    position_filter: list[str] | None = None,
+    state: dict | None = None,
+    renderer: str = "auto",
+) -> None:
+    """
+    Keep a team's grid on screen, updating it as the current week's scores change.
+
+    Each poll fetches only the current week's matchups. The grid is rebuilt
+    and redrawn only when that week's data actually changed, and only that
+    week is re-ranked. get_state can't tell whether games are on, so the
+    week is polled all week long; while its scores stay the same (between
+    game days, or after the last game), polling backs off (see poll_delay)
+    and returns to `interval` as soon as they change. Outside the season,
+    get_state is checked on a slow cadence and no matchups are requested.
+    Runs until interrupted.
+
+    With renderer "auto", the grid is laid out directly rather than through a
+    Rich table whenever it fits the terminal.
+    """
+    next_state_check = 0.0 if state is None else time.monotonic() + STATE_REFRESH_SECONDS
+    last_fingerprint: dict[int, str] = {}
+    unchanged = 0
+
+    def render(status: str) -> Group:
+        report = build_team_report(league, roster, default_name=default_name)
+        args = (report.results, report.team_name, league.season, league.max_week)
+        options = dict(
+            show_points=show_points,
+            position_filter=position_filter,
+            roster_weeks=report.roster_weeks,
+        )
+        table = None
+        if renderer == "auto":
+            grid = build_pixel_grid(*args, **options)
+            if grid is not None and grid.fits(console):
+                table = grid
+        if table is None:
+            table = build_pixel_table(*args, **options)
+        if table is None:
+            table = Text("No performance data found for this roster.", style="yellow")
+        return Group(table, Text(), build_legend(), Text(status, style="dim"))
+
+    initial = render(f"Watching every {interval:g}s (Ctrl+C to stop)")
+    with Live(initial, console=console, auto_refresh=False) as live:
+        while True:
+            now = time.monotonic()
+            if now >= next_state_check:
+                state = api.get_state("nfl")
+                next_state_check = now + STATE_REFRESH_SECONDS
+
+            week = live_week(state, league.season)
+            stamp = datetime.now().strftime("%H:%M:%S")
+            if week is None:
+                status = f"{stamp} No games in progress; checking again later"
+                live.update(render(status), refresh=True)
+                time.sleep(max(interval, STATE_REFRESH_SECONDS))
+                next_state_check = 0.0
+                continue
+
+            matchups = api.get_matchups(league.league_id, week)
+            fingerprint = week_fingerprint(matchups)
+            if fingerprint != last_fingerprint.get(week) and has_scoring_data(matchups):
+                last_fingerprint[week] = fingerprint
+                apply_week(league, week, matchups)
+                unchanged = 0
+                live.update(render(f"{stamp} Week {week} updated"), refresh=True)
+            else:
+                unchanged += 1
+                delay = poll_delay(interval, unchanged)
+                if delay != poll_delay(interval, unchanged - 1):
+                    status = f"{stamp} No new scores; checking every {delay:g}s"
+                    live.update(render(status), refresh=True)
+
+            time.sleep(poll_delay(interval, unchanged))
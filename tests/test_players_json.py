@@ -0,0 +1,127 @@
+"""Tests for the incremental players JSON parser."""
+
+import json
+
+import pytest
+
+from sleeper_pixels.players import PlayerIndex, iter_players_json
+
+# Chunk sizes to split bodies into; None sends the whole body at once
+CHUNK_SIZES = [1, 2, 3, 5, 7, 16, 64, None]
+
+PLAYERS = {
+    "4046": {"full_name": "Patrick Mahomes", "position": "QB", "age": 29},
+    "4034": {"full_name": "Christian McCaffrey", "position": "RB", "years_exp": 7},
+    "9001": {"full_name": "José Núñez", "position": "WR", "search_rank": 1234567},
+    "9002": {"full_name": "Zoë 李 🏈", "position": "TE", "stats": [1.5, -2e3, None]},
+    'quo"te': {"full_name": "Escaped \"Key\"", "position": "K"},
+    "café\\n": {"position": "DEF", "team": "KC", "nested": {"a": {"b": [1, 2]}}},
+    "9003": {},
+}
+
+
+def chunked(data: bytes, size: int | None) -> list[bytes]:
+    """Split data into pieces of `size` bytes."""
+    if size is None:
+        return [data]
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def parse(data: bytes, size: int | None) -> list[tuple[str, dict]]:
+    return list(iter_players_json(chunked(data, size)))
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize(
+    "dumps",
+    [
+        lambda obj: json.dumps(obj),
+        lambda obj: json.dumps(obj, ensure_ascii=False),
+        lambda obj: json.dumps(obj, indent=2),
+        lambda obj: json.dumps(obj, separators=(",", ":")),
+    ],
+    ids=["default", "utf8", "indented", "compact"],
+)
+def test_matches_json_loads(dumps, size):
+    data = dumps(PLAYERS).encode()
+    assert parse(data, size) == list(json.loads(data).items())
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_multibyte_utf8_split_across_chunks(size):
+    data = json.dumps({"1": {"full_name": "Ñandú 🏈 Ω"}}, ensure_ascii=False).encode()
+    assert parse(data, size) == [("1", {"full_name": "Ñandú 🏈 Ω"})]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_escaped_keys(size):
+    data = b'{"a\\"b": {}, "\\u00e9": {"x": 1}, "c\\\\": {}}'
+    assert parse(data, size) == [('a"b', {}), ("é", {"x": 1}), ("c\\", {})]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+@pytest.mark.parametrize("number", ["12345678", "-0.25", "1e10", "3.5E-7", "0"])
+def test_numbers_cut_at_chunk_edges(size, number):
+    data = f'{{"n": {number}, "p": {{"age": {number}}}, "m": {number}}}'.encode()
+    # Only records that are objects are yielded
+    assert parse(data, size) == [("p", {"age": json.loads(number)})]
+
+
+@pytest.mark.parametrize("size", CHUNK_SIZES)
+def test_literals_are_skipped(size):
+    data = b'{"a": true, "b": null, "c": "text", "d": [1, 2], "e": {"x": false}}'
+    assert parse(data, size) == [("e", {"x": False})]
+
+
+@pytest.mark.parametrize("data", [b"{}", b" { } ", b"\n{\n}\n"])
+@pytest.mark.parametrize("size", [1, None])
+def test_empty_object(data, size):
+    assert parse(data, size) == []
+
+
+@pytest.mark.parametrize("size", [1, 3, None])
+@pytest.mark.parametrize(
+    "data",
+    [
+        b"",
+        b"   ",
+        b"[]",
+        b'"players"',
+        b"{",
+        b'{"a"',
+        b'{"a":',
+        b'{"a": {}',
+        b'{"a": {"b": 1}',
+        b'{"a": {"b": "unterminated}}',
+        b'{"a" {}}',
+        b'{"a": {} "b": {}}',
+        b'{"a": {}, }',
+        b'{"a": {},, "b": {}}',
+        b'{1: {}}',
+        b"{'a': {}}",
+        b'{"a": {}}x',
+        b'{"a": {}}{}',
+        b'{"a": 12',
+        b'{"a": {"n": "\xff"}}',
+        b'{"a": {"n": "\xc3"}}',
+    ],
+)
+def test_malformed_bodies_raise(data, size):
+    with pytest.raises(ValueError):
+        parse(data, size)
+
+
+def test_truncated_body_raises_at_every_cut():
+    data = json.dumps(PLAYERS, ensure_ascii=False).encode()
+    for cut in range(len(data)):
+        with pytest.raises(ValueError):
+            parse(data[:cut], 4)
+
+
+def test_from_json_stream_keeps_wanted_positions():
+    data = json.dumps(PLAYERS).encode()
+    index = PlayerIndex.from_json_stream(chunked(data, 3), positions={"QB", "WR"})
+    ids, positions, names = index.columns()
+    assert ids == ["4046", "9001"]
+    assert positions == ["QB", "WR"]
+    assert names == ["Patrick Mahomes", "José Núñez"]